@@ -3,199 +3,330 @@ Script to check if newer versions of dependencies are available on PyPI.
 Reads dependencies from pyproject.toml and compares with latest versions.
 Also displays currently installed versions.
 """
+import argparse
+import asyncio
+import io
+import json
+import re
 import sys
+import time
+import tomllib
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 from importlib import metadata
 
 try:
-    from tomlkit import parse
+    from packaging.version import Version, InvalidVersion
 except ImportError:
-    print("❌ tomlkit is required. Install it with: pip install tomlkit")
+    print("❌ packaging is required. Install it with: pip install packaging")
     sys.exit(1)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter, Retry # requests re-exports urllib3's Retry
 except ImportError:
     print("❌ requests is required. Install it with: pip install requests")
     sys.exit(1)
 
-def get_installed_version(package_name: str) -> str | None:
-    """Get the currently installed version of a package."""
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # fall back to sequential lookups over a pooled requests session
+
+# Shared session, so sequential lookups reuse one keep-alive connection to pypi.org
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=1, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# On-disk cache of PyPI metadata: {package: {"version": ..., "etag": ..., "fetched_at": ...}}
+CACHE_PATH = Path.home() / ".cache" / "gceutils" / "pypi.json"
+CACHE_TTL = 60 * 60  # seconds an entry is trusted without revalidation
+
+_NAME_SEP_RE = re.compile(r"[-_.]+")
+
+
+def load_cache(cache_path: Path = CACHE_PATH) -> dict[str, dict]:
+    """Load the PyPI metadata cache, returning an empty cache if it is missing or unreadable."""
     try:
-        return metadata.version(package_name)
-    except metadata.PackageNotFoundError:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict[str, dict], cache_path: Path = CACHE_PATH) -> None:
+    """Write the PyPI metadata cache to disk."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write cache to {cache_path}: {e}")
+
+
+def _fresh_cached_version(cache: dict[str, dict] | None, package_name: str, installed_version: str | None = None) -> str | None:
+    """Return the cached version if the entry can be trusted without asking PyPI, else None.
+    An entry is trusted while it is younger than CACHE_TTL and not older than the installed version.
+    """
+    entry = cache.get(package_name) if cache is not None else None
+    if not entry or (time.time() - entry["fetched_at"] >= CACHE_TTL):
         return None
+    # An installed version ahead of the cached one means PyPI has released since the entry was stored
+    if installed_version is not None and compare_versions(installed_version, entry["version"]) == "⚠️":
+        return None
+    return entry["version"]
+
+
+def _conditional_headers(cache: dict[str, dict] | None, package_name: str) -> dict[str, str]:
+    """Build If-None-Match headers from a cached ETag so unchanged metadata comes back as a 304."""
+    entry = cache.get(package_name) if cache is not None else None
+    if entry and entry.get("etag"):
+        return {"If-None-Match": entry["etag"]}
+    return {}
 
 
-def get_latest_version_pypi(package_name: str) -> str | None:
-    """Fetch the latest version of a package from PyPI."""
+def _store_response(cache: dict[str, dict] | None, package_name: str, status: int, etag: str | None, version: str | None) -> str | None:
+    """Update the cache from a PyPI response and return the resulting version."""
+    if cache is None:
+        return version
+    if status == 304 and package_name in cache:
+        cache[package_name]["fetched_at"] = time.time()
+        return cache[package_name]["version"]
+    if version is not None:
+        cache[package_name] = {"version": version, "etag": etag, "fetched_at": time.time()}
+    return version
+
+
+def normalize_package_name(package_name: str) -> str:
+    """Normalize a distribution name as in PEP 503, e.g. 'Typing_Extensions' -> 'typing-extensions'."""
+    return _NAME_SEP_RE.sub("-", package_name).lower()
+
+
+def get_installed_versions() -> dict[str, str]:
+    """Map the normalized name of every installed distribution to its version, scanning site-packages once."""
+    installed = {}
+    for distribution in metadata.distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            # the first match on sys.path wins, same as importlib.metadata.version
+            installed.setdefault(normalize_package_name(name), distribution.version)
+    return installed
+
+
+def get_latest_version_pypi(package_name: str, cache: dict[str, dict] | None = None) -> str | None:
+    """Fetch the latest version of a package from PyPI, revalidating and updating `cache` if given."""
     try:
-        response = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return data["info"]["version"]
+        response = _session.get(
+            f"https://pypi.org/pypi/{package_name}/json",
+            headers=_conditional_headers(cache, package_name), timeout=5,
+        )
+        if response.status_code in (200, 304):
+            version = response.json()["info"]["version"] if response.status_code == 200 else None
+            return _store_response(cache, package_name, response.status_code, response.headers.get("ETag"), version)
     except Exception as e:
         print(f"⚠️  Warning: Could not fetch version for {package_name}: {e}")
     return None
 
 
+async def fetch_latest(
+        session: "aiohttp.ClientSession", package_name: str, cache: dict[str, dict] | None = None,
+    ) -> tuple[str, str | None]:
+    """Fetch the latest version of a package from PyPI using a shared aiohttp session."""
+    try:
+        async with session.get(
+            f"https://pypi.org/pypi/{package_name}/json",
+            headers=_conditional_headers(cache, package_name), timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
+            if response.status in (200, 304):
+                version = (await response.json())["info"]["version"] if response.status == 200 else None
+                return package_name, _store_response(cache, package_name, response.status, response.headers.get("ETag"), version)
+    except Exception as e:
+        print(f"⚠️  Warning: Could not fetch version for {package_name}: {e}")
+    return package_name, None
+
+
+async def _gather_all(package_names: list[str], cache: dict[str, dict] | None) -> list[tuple[str, str | None]]:
+    """Fetch the latest versions of all packages concurrently over one connection pool."""
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20)) as session:
+        return await asyncio.gather(*[fetch_latest(session, name, cache) for name in package_names])
+
+
+def get_latest_versions_pypi(
+        package_names: list[str], cache: dict[str, dict] | None = None, refresh: bool = False,
+        installed: dict[str, str | None] | None = None,
+    ) -> dict[str, str | None]:
+    """Fetch the latest versions of multiple packages from PyPI, concurrently if aiohttp is available.
+    Packages with a trustworthy cache entry are answered from `cache` and only the rest are requested,
+    unless `refresh` forces all of them to be revalidated.
+    """
+    latest = {}
+    to_fetch = []
+    for name in package_names:
+        cached_version = None if refresh else _fresh_cached_version(cache, name, (installed or {}).get(name))
+        if cached_version is None:
+            to_fetch.append(name)
+        else:
+            latest[name] = cached_version
+    
+    if not to_fetch:
+        return latest
+    if aiohttp is None:
+        latest.update((name, get_latest_version_pypi(name, cache)) for name in to_fetch)
+    else:
+        latest.update(asyncio.run(_gather_all(to_fetch, cache)))
+    return latest
+
+
+# Version specifier operators, longer ones first so "~=" is not matched as "="
+_OP_RE = re.compile(r"(~=|==|>=|<=|!=|>|<)")
+
+
+@lru_cache(maxsize=None)
 def parse_dependency(dep_string: str) -> tuple[str, str]:
     """Parse a dependency string like 'package==1.2.3' or 'package~=1.2' into (name, version)."""
-    # Handle different version specifiers: ==, ~=, >=, <=, >, <
-    for operator in ["~=", "==", ">=", "<=", ">", "<"]:
-        if operator in dep_string:
-            parts = dep_string.split(operator)
-            return parts[0].strip(), parts[1].strip()
+    parts = _OP_RE.split(dep_string, maxsplit=1)
+    if len(parts) == 3:
+        return parts[0].strip(), parts[2].strip()
     return dep_string.strip(), None
 
 
 def compare_versions(current: str, latest: str) -> str:
-    """Compare version strings and return status."""
-    if current == latest:
-        return "✅"
-    
-    # Simple version comparison (split by dots and compare)
+    """Compare PEP 440 version strings and return status."""
     try:
-        current_parts = [int(x) for x in current.split('.')]
-        latest_parts = [int(x) for x in latest.split('.')]
-        
-        # Pad to same length
-        max_len = max(len(current_parts), len(latest_parts))
-        current_parts += [0] * (max_len - len(current_parts))
-        latest_parts += [0] * (max_len - len(latest_parts))
-        
-        if current_parts < latest_parts:
-            return "🔄"  # Update available
-        elif current_parts > latest_parts:
-            return "⚠️"  # Current is newer than PyPI (unusual)
-        else:
-            return "✅"
-    except (ValueError, AttributeError):
+        current_version, latest_version = Version(current), Version(latest)
+    except (InvalidVersion, TypeError):
         return "❓"
+    
+    if current_version == latest_version:
+        return "✅"
+    elif current_version < latest_version:
+        return "🔄"  # Update available
+    else:
+        return "⚠️"  # Current is newer than PyPI (unusual)
+
+
+# Column layout of the report table
+_ROW = "{:<25} {:<18} {:<18} {:<18} {:<10}".format
+
+
+def emit_row(package_name: str, current_version: str | None, installed_version: str | None, latest_version: str | None) -> str:
+    """Print one row of the report table and return the status shown in it."""
+    if latest_version and current_version:
+        status = compare_versions(current_version, latest_version)
+    elif latest_version:
+        status = "ℹ️"  # No version specified in pyproject.toml, just show latest
+    else:
+        status = "❌"
+    print(_ROW(package_name, current_version or "any", installed_version or "Not installed", latest_version or "N/A", status))
+    return status
+
+
+def _scan_block(title: str, deps: list[str], latest_map: dict, installed_map: dict) -> tuple[list, list]:
+    """Print the table for one dependency group and return its (updates, not_installed) lists."""
+    updates, not_installed = [], []
+    if not deps:
+        return updates, not_installed
+    
+    print(f"\n{title}")
+    print("-" * 105)
+    print(_ROW("Package", "pyproject.toml", "Installed", "Latest (PyPI)", "Status"))
+    print("-" * 105)
+    for dep in deps:
+        package_name, current_version = parse_dependency(dep)
+        installed_version = installed_map[package_name]
+        latest_version = latest_map.get(package_name)
+    
+        if emit_row(package_name, current_version, installed_version, latest_version) == "🔄":
+            updates.append((package_name, current_version, latest_version))
+    
+        if not installed_version:
+            not_installed.append(package_name)
+    return updates, not_installed
 
 
-def check_dependencies(pyproject_path: Path) -> None:
-    """Check all dependencies in pyproject.toml for updates."""
+def check_dependencies(pyproject_path: Path, use_cache: bool = True, refresh: bool = False) -> None:
+    """Check all dependencies in pyproject.toml for updates.
+    With `use_cache`, PyPI metadata is read from and written to CACHE_PATH; `refresh` revalidates every entry.
+    """
     if not pyproject_path.exists():
         print(f"❌ pyproject.toml not found at {pyproject_path}")
         sys.exit(1)
     
     with open(pyproject_path, 'r', encoding='utf-8') as f:
-        toml_content = parse(f.read())
+        toml_content = tomllib.loads(f.read())
     
     project = toml_content.get("project", {})
     dependencies = project.get("dependencies", [])
     optional_deps = project.get("optional-dependencies", {})
     dev_deps = optional_deps.get("dev", [])
     
-    print("=" * 105)
-    print("🔍 Checking dependency versions against PyPI")
-    print("=" * 105)
-    
-    # Check main dependencies
-    if dependencies:
-        print("\n📦 Runtime Dependencies:")
-        print("-" * 105)
-        print(f"{'Package':<25} {'pyproject.toml':<18} {'Installed':<18} {'Latest (PyPI)':<18} {'Status':<10}")
-        print("-" * 105)
-        
-        updates_available = []
-        not_installed = []
-        for dep in dependencies:
-            package_name, current_version = parse_dependency(dep)
-            installed_version = get_installed_version(package_name)
-            latest_version = get_latest_version_pypi(package_name)
-            
-            current_str = current_version if current_version else "any"
-            installed_str = installed_version if installed_version else "Not installed"
-            latest_str = latest_version if latest_version else "N/A"
-            
-            if latest_version and current_version:
-                status = compare_versions(current_version, latest_version)
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {status:<10}")
-                
-                if status == "🔄":
-                    updates_available.append((package_name, current_version, latest_version))
-            elif latest_version:
-                # No version specified in pyproject.toml, just show latest
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {'ℹ️':<10}")
-            else:
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {'❌':<10}")
-            
-            if not installed_version:
-                not_installed.append(package_name)
-    
-    # Check dev dependencies
-    if dev_deps:
-        print("\n🛠️  Dev Dependencies:")
-        print("-" * 105)
-        print(f"{'Package':<25} {'pyproject.toml':<18} {'Installed':<18} {'Latest (PyPI)':<18} {'Status':<10}")
-        print("-" * 105)
-        
-        dev_updates_available = []
-        dev_not_installed = []
-        for dep in dev_deps:
-            package_name, current_version = parse_dependency(dep)
-            installed_version = get_installed_version(package_name)
-            latest_version = get_latest_version_pypi(package_name)
-            
-            current_str = current_version if current_version else "any"
-            installed_str = installed_version if installed_version else "Not installed"
-            latest_str = latest_version if latest_version else "N/A"
-            
-            if latest_version and current_version:
-                status = compare_versions(current_version, latest_version)
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {status:<10}")
-                
-                if status == "🔄":
-                    dev_updates_available.append((package_name, current_version, latest_version))
-            elif latest_version:
-                # No version specified in pyproject.toml, just show latest
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {'ℹ️':<10}")
-            else:
-                print(f"{package_name:<25} {current_str:<18} {installed_str:<18} {latest_str:<18} {'❌':<10}")
-            
-            if not installed_version:
-                dev_not_installed.append(package_name)
-    
-    # Summary
-    print("\n" + "=" * 105)
-    print("📊 Summary:")
-    print("=" * 105)
-    
-    total_updates = len(updates_available) if dependencies else 0
-    total_dev_updates = len(dev_updates_available) if dev_deps else 0
-    
-    if total_updates > 0:
-        print(f"\n🔄 {total_updates} runtime dependency update(s) available:")
-        for pkg, current, latest in updates_available:
-            print(f"   • {pkg}: {current} → {latest}")
-    
-    if total_dev_updates > 0:
-        print(f"\n🔄 {total_dev_updates} dev dependency update(s) available:")
-        for pkg, current, latest in dev_updates_available:
-            print(f"   • {pkg}: {current} → {latest}")
-    
-    if not_installed:
-        print(f"\n⚠️  {len(not_installed)} runtime package(s) not installed:")
-        for pkg in not_installed:
-            print(f"   • {pkg}")
-    
-    if dev_not_installed:
-        print(f"\n⚠️  {len(dev_not_installed)} dev package(s) not installed:")
-        for pkg in dev_not_installed:
-            print(f"   • {pkg}")
-    
-    if total_updates == 0 and total_dev_updates == 0:
-        print("\n✅ All dependencies are up to date!")
-    
-    print("\n" + "=" * 105)
-    print("Legend: ✅ Up to date  |  🔄 Update available  |  ⚠️ Ahead of PyPI  |  ❓ Cannot compare  |  ℹ️ No version constraint")
-    print("=" * 105)
+    # Fetch all latest versions up front, concurrently and only where the cache can not answer
+    package_names = list(dict.fromkeys(parse_dependency(dep)[0] for dep in [*dependencies, *dev_deps]))
+    installed_versions = get_installed_versions()
+    installed = {name: installed_versions.get(normalize_package_name(name)) for name in package_names}
+    cache = load_cache() if use_cache else None
+    latest = get_latest_versions_pypi(package_names, cache, refresh, installed)
+    if cache is not None:
+        save_cache(cache)
+    
+    # Collect the report and write it in one go instead of one write per line
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print("=" * 105)
+        print("🔍 Checking dependency versions against PyPI")
+        print("=" * 105)
+    
+        updates_available, not_installed = _scan_block("📦 Runtime Dependencies:", dependencies, latest, installed)
+        dev_updates_available, dev_not_installed = _scan_block("🛠️  Dev Dependencies:", dev_deps, latest, installed)
+    
+        # Summary
+        print("\n" + "=" * 105)
+        print("📊 Summary:")
+        print("=" * 105)
+    
+        total_updates = len(updates_available) if dependencies else 0
+        total_dev_updates = len(dev_updates_available) if dev_deps else 0
+    
+        if total_updates > 0:
+            print(f"\n🔄 {total_updates} runtime dependency update(s) available:")
+            for pkg, current, latest in updates_available:
+                print(f"   • {pkg}: {current} → {latest}")
+    
+        if total_dev_updates > 0:
+            print(f"\n🔄 {total_dev_updates} dev dependency update(s) available:")
+            for pkg, current, latest in dev_updates_available:
+                print(f"   • {pkg}: {current} → {latest}")
+    
+        if not_installed:
+            print(f"\n⚠️  {len(not_installed)} runtime package(s) not installed:")
+            for pkg in not_installed:
+                print(f"   • {pkg}")
+    
+        if dev_not_installed:
+            print(f"\n⚠️  {len(dev_not_installed)} dev package(s) not installed:")
+            for pkg in dev_not_installed:
+                print(f"   • {pkg}")
+    
+        if total_updates == 0 and total_dev_updates == 0:
+            print("\n✅ All dependencies are up to date!")
+    
+        print("\n" + "=" * 105)
+        print("Legend: ✅ Up to date  |  🔄 Update available  |  ⚠️ Ahead of PyPI  |  ❓ Cannot compare  |  ℹ️ No version constraint")
+        print("=" * 105)
+    sys.stdout.write(report.getvalue())
+    
+    _session.close()
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Check if newer versions of the pyproject.toml dependencies are available on PyPI."
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the on-disk PyPI metadata cache")
+    parser.add_argument("--refresh", action="store_true", help="Revalidate all cached PyPI metadata, even if it is still fresh")
+    args = parser.parse_args()
+
     # Find pyproject.toml in the project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -204,7 +335,7 @@ def main():
     print(f"📂 Project root: {project_root}")
     print(f"📄 Reading: {pyproject_path}\n")
     
-    check_dependencies(pyproject_path)
+    check_dependencies(pyproject_path, use_cache=not args.no_cache, refresh=args.refresh)
 
 
 if __name__ == "__main__":
@@ -1,28 +1,91 @@
 import argparse
-import subprocess
+import ast
+import io
+import re
 import sys
+import tomllib
+from contextlib import redirect_stdout
+from importlib import metadata
 from pathlib import Path
+from typing import NamedTuple
 from tomlkit import parse, document, table, array, dumps
 
-def run_pipreqs(paths):
-    """Run pipreqs on one or more paths and return a set of (pkg, version)."""
-    packages = set()
+# Version specifier operators, longer ones first so "~=" is not matched as "="
+_OP_RE = re.compile(r"(~=|==|>=|<=|!=|>|<)")
+
+class Dep(NamedTuple):
+    """A dependency as currently declared in pyproject.toml."""
+    pkg: str
+    version: str | None
+    op: str | None
+    raw: str
+
+class Det(NamedTuple):
+    """A dependency detected from the imports, with its recommended version spec."""
+    pkg: str
+    version_spec: str
+
+def _local_module_names(paths):
+    """Collect the top-level module and package names defined directly inside the scanned roots.
+    Nested files are not included, so a test or helper named like a real package does not hide it.
+    """
+    names = set()
     for path in paths:
-        if not path.exists():
+        names.add(path.name)
+        for child in path.iterdir():
+            if child.suffix == ".py":
+                names.add(child.stem)
+            elif child.is_dir() and child.name != "__pycache__":
+                names.add(child.name)
+    return names
+
+def _scan(paths):
+    """Parse every Python file below paths and map each imported top-level module to the paths importing it."""
+    imports = {}
+    for path in paths:
+        for file in path.rglob("*.py"):
+            try:
+                tree = ast.parse(file.read_bytes(), filename=str(file))
+            except SyntaxError as e:
+                print(f"⚠️  Warning: Could not parse {file}: {e}")
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    modules = [alias.name for alias in node.names]
+                elif isinstance(node, ast.ImportFrom) and (node.level == 0) and node.module:
+                    modules = [node.module]
+                else:
+                    continue
+                for module in modules:
+                    imports.setdefault(module.partition(".")[0], set()).add(path)
+    return imports
+
+def scan_dependencies(runtime_path, dev_paths):
+    """Detect third-party imports in one pass and return (runtime_deps, dev_deps) as sets of (pkg, version).
+    Packages imported below runtime_path are runtime dependencies, the remaining ones are dev dependencies.
+    """
+    paths = [path for path in [runtime_path, *dev_paths] if path.exists()]
+    ignored = set(sys.stdlib_module_names) | _local_module_names(paths)
+    distributions = metadata.packages_distributions()
+
+    runtime_deps, dev_deps = set(), set()
+    for module, importing_paths in _scan(paths).items():
+        if module in ignored:
             continue
-        result = subprocess.run(
-            ["pipreqs", str(path), "--force", "--print", "--encoding", "utf-8"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"❌ pipreqs failed for {path}:", result.stderr)
-            sys.exit(1)
-        for line in result.stdout.strip().splitlines():
-            if "==" in line:
-                pkg, version = line.strip().split("==", 1)
-                packages.add((pkg.strip(), version.strip()))
-    return packages
+        dist_names = distributions.get(module)
+        if not dist_names:
+            print(f"⚠️  Warning: No installed distribution provides {module!r}, install it to include it")
+            continue
+        # Several distributions can provide one module, pick the same one on every run
+        dist_name, *others = sorted(set(dist_names), key=str.lower)
+        if others:
+            print(f"⚠️  Warning: {module!r} is provided by several distributions {[dist_name, *others]}, using {dist_name!r}")
+        dependency = (dist_name, metadata.version(dist_name))
+        if runtime_path in importing_paths:
+            runtime_deps.add(dependency)
+        else:
+            dev_deps.add(dependency)
+    return runtime_deps, dev_deps
 
 def format_version_spec(version):
     """Convert a full version to a compatible release specifier (~=).
@@ -35,44 +98,49 @@ def format_version_spec(version):
 
 def parse_dependency_spec(dep_string):
     """Parse a dependency spec into (package, version_spec, operator)."""
-    for op in ["~=", ">=", "<=", "==", "!="]:
-        if op in dep_string:
-            pkg, version = dep_string.split(op, 1)
-            return pkg.strip(), version.strip(), op
+    parts = _OP_RE.split(dep_string, maxsplit=1)
+    if len(parts) == 3:
+        pkg, op, version = parts
+        return pkg.strip(), version.strip(), op
     return dep_string.strip(), None, None
 
 
 def compare_dependencies(current_deps, detected_deps, dep_type="runtime"):
     """Compare current vs detected dependencies and return analysis."""
-    current_dict = {}
-    for dep in current_deps:
-        pkg, version, op = parse_dependency_spec(dep)
-        current_dict[pkg.lower()] = (pkg, version, op, dep)
+    current = [Dep(*parse_dependency_spec(dep), dep) for dep in current_deps]
+    detected = [Det(pkg, format_version_spec(version)) for pkg, version in detected_deps]
+    # Nothing to report when pyproject.toml already pins exactly what was detected
+    if (frozenset((dep.pkg.lower(), dep.version, dep.op) for dep in current)
+            == frozenset((det.pkg.lower(), det.version_spec, "~=") for det in detected)):
+        return [], [], []
     
-    detected_dict = {}
-    for pkg, version in detected_deps:
-        version_spec = format_version_spec(version)
-        detected_dict[pkg.lower()] = (pkg, version_spec)
+    current_dict = {dep.pkg.lower(): dep for dep in current}
+    detected_dict = {det.pkg.lower(): det for det in detected}
+    detected_keys, current_keys = detected_dict.keys(), current_dict.keys()
     
-    missing = []  # In code but not in pyproject.toml
-    extra = []    # In pyproject.toml but not detected in code
-    version_changes = []  # Different versions
-    
-    for pkg_lower, (pkg, version_spec) in detected_dict.items():
-        if pkg_lower not in current_dict:
-            missing.append((pkg, version_spec))
-        else:
-            curr_pkg, curr_version, curr_op, _ = current_dict[pkg_lower]
-            if curr_version != version_spec or curr_op != "~=":
-                version_changes.append((curr_pkg, f"{curr_op}{curr_version}" if curr_op else "any", pkg, f"~={version_spec}"))
-    
-    for pkg_lower, (pkg, version, op, original) in current_dict.items():
-        if pkg_lower not in detected_dict:
-            extra.append((pkg, f"{op}{version}" if op else "any"))
+    # In code but not in pyproject.toml
+    missing = [detected_dict[key] for key in sorted(detected_keys - current_keys)]
+    # In pyproject.toml but not detected in code
+    extra = []
+    for key in sorted(current_keys - detected_keys):
+        curr = current_dict[key]
+        extra.append((curr.pkg, f"{curr.op}{curr.version}" if curr.op else "any"))
+    # Different versions
+    version_changes = []
+    for key in sorted(detected_keys & current_keys):
+        det, curr = detected_dict[key], current_dict[key]
+        if curr.version != det.version_spec or curr.op != "~=":
+            version_changes.append((curr.pkg, f"{curr.op}{curr.version}" if curr.op else "any", det.pkg, f"~={det.version_spec}"))
     
     return missing, extra, version_changes
 
 
+def _emit_deps(deps_array, deps):
+    """Append (pkg, version) pairs as compatible release specifiers, ordered case-insensitively by package."""
+    for pkg, version in sorted(deps, key=lambda dep: dep[0].lower()):
+        deps_array.append(f"{pkg}~={format_version_spec(version)}")
+    return deps_array
+
 def update_project_section(existing_toml, runtime_deps, dev_deps, project_name, version):
     """Update the [project] section and optional [project.optional-dependencies]."""
     project = existing_toml.get("project", table())
@@ -83,19 +151,11 @@ def update_project_section(existing_toml, runtime_deps, dev_deps, project_name,
         project["version"] = version
 
     # runtime dependencies
-    deps_array = array().multiline(True)
-    for pkg, version in sorted(runtime_deps):
-        version_spec = format_version_spec(version)
-        deps_array.append(f"{pkg}~={version_spec}")
-    project["dependencies"] = deps_array
+    project["dependencies"] = _emit_deps(array().multiline(True), runtime_deps)
 
     # dev dependencies under optional-dependencies.dev
     optional = project.get("optional-dependencies", table())
-    dev_array = array().multiline(True)
-    for pkg, version in sorted(dev_deps):
-        version_spec = format_version_spec(version)
-        dev_array.append(f"{pkg}~={version_spec}")
-    optional["dev"] = dev_array
+    optional["dev"] = _emit_deps(array().multiline(True), dev_deps)
     project["optional-dependencies"] = optional
 
     existing_toml["project"] = project
@@ -119,90 +179,91 @@ def main():
 
     # runtime dependencies: only the main project folder
     runtime_path = project_root / "src" / "gceutils"
-    runtime_deps = run_pipreqs([runtime_path])
-
     # dev dependencies: scripts, tests, docs
     dev_paths = [project_root / "scripts", project_root / "tests", project_root / "docs"]
-    dev_deps = run_pipreqs(dev_paths) - runtime_deps  # avoid duplicates
+    runtime_deps, dev_deps = scan_dependencies(runtime_path, dev_paths)
 
     if not runtime_deps and not dev_deps:
         print("⚠️  No dependencies found.")
         sys.exit(0)
 
     # Read existing pyproject.toml
+    # Analysis only reads, so use the fast stdlib parser; tomlkit is only needed for --apply
     if output_path.exists():
         toml_text = output_path.read_text(encoding="utf-8")
-        toml_data = parse(toml_text)
-        project = toml_data.get("project", {})
+        project = tomllib.loads(toml_text).get("project", {})
         current_runtime_deps = project.get("dependencies", [])
         optional_deps = project.get("optional-dependencies", {})
         current_dev_deps = optional_deps.get("dev", [])
     else:
         print("⚠️  pyproject.toml not found. Creating new file.")
-        toml_data = document()
+        toml_text = None
         current_runtime_deps = []
         current_dev_deps = []
 
-    # Analyze differences
-    print("\n" + "=" * 90)
-    print("📊 DEPENDENCY ANALYSIS")
-    print("=" * 90)
+    # Analyze differences, collecting the report to write it in one go instead of one write per line
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print("\n" + "=" * 90)
+        print("📊 DEPENDENCY ANALYSIS")
+        print("=" * 90)
 
-    # Runtime dependencies
-    missing_runtime, extra_runtime, changed_runtime = compare_dependencies(
-        current_runtime_deps, runtime_deps, "runtime"
-    )
+        # Runtime dependencies
+        missing_runtime, extra_runtime, changed_runtime = compare_dependencies(
+            current_runtime_deps, runtime_deps, "runtime"
+        )
 
-    if missing_runtime or extra_runtime or changed_runtime:
-        print("\n📦 Runtime Dependencies:")
-        print("-" * 90)
+        if missing_runtime or extra_runtime or changed_runtime:
+            print("\n📦 Runtime Dependencies:")
+            print("-" * 90)
         
-        if missing_runtime:
-            print("\n❌ MISSING (detected in code but not in pyproject.toml):")
-            for pkg, version_spec in missing_runtime:
-                print(f"   + {pkg}~={version_spec}")
+            if missing_runtime:
+                print("\n❌ MISSING (detected in code but not in pyproject.toml):")
+                for pkg, version_spec in missing_runtime:
+                    print(f"   + {pkg}~={version_spec}")
         
-        if changed_runtime:
-            print("\n🔄 VERSION UPDATES (detected different version or constraint):")
-            for curr_pkg, curr_spec, new_pkg, new_spec in changed_runtime:
-                print(f"   ~ {curr_pkg}{curr_spec} → {new_pkg}{new_spec}")
+            if changed_runtime:
+                print("\n🔄 VERSION UPDATES (detected different version or constraint):")
+                for curr_pkg, curr_spec, new_pkg, new_spec in changed_runtime:
+                    print(f"   ~ {curr_pkg}{curr_spec} → {new_pkg}{new_spec}")
         
-        if extra_runtime:
-            print("\n⚠️  EXTRA (in pyproject.toml but not detected in code):")
-            print("   (These might be optional dependencies or false negatives from pipreqs)")
-            for pkg, spec in extra_runtime:
-                print(f"   ? {pkg}{spec}")
-    else:
-        print("\n📦 Runtime Dependencies: ✅ All up to date!")
+            if extra_runtime:
+                print("\n⚠️  EXTRA (in pyproject.toml but not detected in code):")
+                print("   (These might be optional dependencies or false negatives from the import scan)")
+                for pkg, spec in extra_runtime:
+                    print(f"   ? {pkg}{spec}")
+        else:
+            print("\n📦 Runtime Dependencies: ✅ All up to date!")
 
-    # Dev dependencies
-    missing_dev, extra_dev, changed_dev = compare_dependencies(
-        current_dev_deps, dev_deps, "dev"
-    )
+        # Dev dependencies
+        missing_dev, extra_dev, changed_dev = compare_dependencies(
+            current_dev_deps, dev_deps, "dev"
+        )
 
-    if missing_dev or extra_dev or changed_dev:
-        print("\n🛠️  Dev Dependencies:")
-        print("-" * 90)
+        if missing_dev or extra_dev or changed_dev:
+            print("\n🛠️  Dev Dependencies:")
+            print("-" * 90)
         
-        if missing_dev:
-            print("\n❌ MISSING (detected in code but not in pyproject.toml):")
-            for pkg, version_spec in missing_dev:
-                print(f"   + {pkg}~={version_spec}")
+            if missing_dev:
+                print("\n❌ MISSING (detected in code but not in pyproject.toml):")
+                for pkg, version_spec in missing_dev:
+                    print(f"   + {pkg}~={version_spec}")
         
-        if changed_dev:
-            print("\n🔄 VERSION UPDATES (detected different version or constraint):")
-            for curr_pkg, curr_spec, new_pkg, new_spec in changed_dev:
-                print(f"   ~ {curr_pkg}{curr_spec} → {new_pkg}{new_spec}")
+            if changed_dev:
+                print("\n🔄 VERSION UPDATES (detected different version or constraint):")
+                for curr_pkg, curr_spec, new_pkg, new_spec in changed_dev:
+                    print(f"   ~ {curr_pkg}{curr_spec} → {new_pkg}{new_spec}")
         
-        if extra_dev:
-            print("\n⚠️  EXTRA (in pyproject.toml but not detected in code):")
-            print("   (These might be optional dependencies or false negatives from pipreqs)")
-            for pkg, spec in extra_dev:
-                print(f"   ? {pkg}{spec}")
-    else:
-        print("\n🛠️  Dev Dependencies: ✅ All up to date!")
+            if extra_dev:
+                print("\n⚠️  EXTRA (in pyproject.toml but not detected in code):")
+                print("   (These might be optional dependencies or false negatives from the import scan)")
+                for pkg, spec in extra_dev:
+                    print(f"   ? {pkg}{spec}")
+        else:
+            print("\n🛠️  Dev Dependencies: ✅ All up to date!")
 
-    print("\n" + "=" * 90)
+        print("\n" + "=" * 90)
+    sys.stdout.write(report.getvalue())
 
     # Decide what to do
     has_changes = (missing_runtime or changed_runtime or missing_dev or changed_dev)
@@ -214,6 +275,8 @@ def main():
     if args.apply:
         print("\n⚙️  Applying changes to pyproject.toml...")
         project_name = args.project_name or project_root.name
+        # Re-parse with tomlkit to preserve formatting and comments in the rewrite
+        toml_data = parse(toml_text) if toml_text is not None else document()
         toml_data = update_project_section(toml_data, runtime_deps, dev_deps, project_name, args.version)
         output_text = dumps(toml_data)
         output_path.write_text(output_text, encoding="utf-8")
@@ -1,7 +1,6 @@
 from __future__  import annotations
-from copy        import copy
 from dataclasses import dataclass, fields as get_fields, field as base_field, Field, MISSING, _MISSING_TYPE
-from types       import MappingProxyType, NoneType
+from types       import GenericAlias, MappingProxyType, NoneType
 from typing      import (
     Any, NoReturn, Callable, Iterable, Iterator, SupportsIndex, Any, Protocol,
     overload, get_type_hints, dataclass_transform, TYPE_CHECKING,
@@ -13,7 +12,17 @@ if TYPE_CHECKING:
 
 VALIDATOR_FN = Callable | NoneType # TODO
 
-FIELD_OPTIONS: dict[Field, dict[str, Any]] = {}
+FIELD_OPTION_DEFAULTS: dict[str, Any] = dict(
+    grepr=True,
+    validate_type=True,
+    validator_fn=None,
+    validate_require_exist=True,
+    call_subvalidate=False,
+)
+
+class GreprField(Field):
+    """A dataclass Field which additionally stores the @grepr_dataclass validation and representation options."""
+    __slots__ = tuple(FIELD_OPTION_DEFAULTS)
 
 def field(*,
         default: Any | _MISSING_TYPE = MISSING, default_factory: Callable[[], Any] | _MISSING_TYPE = MISSING, 
@@ -48,28 +57,70 @@ def field(*,
     )
     if (validator_fn is not None) and (not callable(validator_fn)):
         raise ValueError("validator_fn must be a function or callable")
-    update_field(field, grepr, validate_type, validator_fn, validate_require_exist, call_subvalidate)
-    return field
+    return _make_grepr_field(field, dict(
+        grepr=grepr,
+        validate_type=validate_type,
+        validator_fn=validator_fn,
+        validate_require_exist=validate_require_exist,
+        call_subvalidate=call_subvalidate,
+    ))
+
+def _make_grepr_field(field: Field, options: dict[str, Any]) -> GreprField:
+    """Copy a plain Field into a GreprField carrying the given options."""
+    new_field = GreprField.__new__(GreprField)
+    for slot in Field.__slots__:
+        if hasattr(field, slot):
+            object.__setattr__(new_field, slot, getattr(field, slot))
+    for name, value in options.items():
+        object.__setattr__(new_field, name, value)
+    return new_field
+
+# Options of plain dataclass Fields passed to update_field; Field has __slots__, so they can not live on the field
+_PLAIN_FIELD_OPTIONS: dict[Field, dict[str, Any]] = {}
 
 def update_field(field: Field,
         grepr: bool = True,
         validate_type: bool = True, validator_fn: VALIDATOR_FN = None,
         validate_require_exist: bool = True, call_subvalidate: bool = False,
     ) -> None:
-    """Store custom field options for use by @grepr_dataclass validation and representation."""
-    if field not in FIELD_OPTIONS:
-        FIELD_OPTIONS[field] = dict(
-            grepr=grepr,
-            validate_type=validate_type,
-            validator_fn=validator_fn,
-            validate_require_exist=validate_require_exist,
-            call_subvalidate=call_subvalidate,
-        )
+    """
+    Store custom field options for use by @grepr_dataclass validation and representation.
+    The first options stored for a plain Field win; fields made by `field` already carry their options and are left unchanged.
+    """
+    if isinstance(field, GreprField):
+        return
+    _PLAIN_FIELD_OPTIONS.setdefault(field, dict(
+        grepr=grepr,
+        validate_type=validate_type,
+        validator_fn=validator_fn,
+        validate_require_exist=validate_require_exist,
+        call_subvalidate=call_subvalidate,
+    ))
+
+def _get_field_option(field: Field, name: str) -> Any:
+    """Retrieve a single custom option for a field, falling back to the default."""
+    if isinstance(field, GreprField):
+        return getattr(field, name)
+    options = _PLAIN_FIELD_OPTIONS.get(field)
+    return FIELD_OPTION_DEFAULTS[name] if options is None else options[name]
 
 def get_field_options(field: Field) -> dict[str, Any]:
-    """Retrieve custom options for a field, ensuring they are registered if not present."""
-    update_field(field)
-    return FIELD_OPTIONS[field]
+    """Retrieve custom options for a field, falling back to the defaults for plain dataclass fields."""
+    if isinstance(field, GreprField):
+        return {name: getattr(field, name) for name in FIELD_OPTION_DEFAULTS}
+    options = _PLAIN_FIELD_OPTIONS.get(field)
+    return dict(FIELD_OPTION_DEFAULTS if options is None else options)
+
+# Filled on first use: these modules import base themselves, so they can not be imported at module level
+_DEFERRED_IMPORTS: dict[str, Any] = {}
+
+def _load_deferred_imports() -> dict[str, Any]:
+    from gceutils.decorators import enforce_type
+    from gceutils.repr       import GreprRepresentationImplementation
+
+    _DEFERRED_IMPORTS["enforce_type"] = enforce_type
+    _DEFERRED_IMPORTS["GreprRepresentationImplementation"] = GreprRepresentationImplementation
+    return _DEFERRED_IMPORTS
 
 @dataclass_transform(
     eq_default = True,
@@ -110,7 +161,6 @@ class GreprDataclassImplementation:
 
     def apply[T](self, cls: T) -> T:
         cls = self.apply_dataclass(cls)
-        self.initialize_field_options(cls)
         self.apply_forbid_init_only_subclasses(cls)
         self.apply_repr(cls)
         self.apply_validate(cls)
@@ -125,10 +175,6 @@ class GreprDataclassImplementation:
             slots=self.slots, weakref_slot=self.weakref_slot,
         )
 
-    def initialize_field_options(self, cls: type[Any]) -> None:
-        for _field in get_fields(cls):
-            update_field(_field)
-
     def apply_forbid_init_only_subclasses(self, cls: type[Any]) -> None:
         if not self.forbid_init_only_subcls:
             return
@@ -147,9 +193,7 @@ class GreprDataclassImplementation:
     def get_repr_implementation(self):
         if self.repr_implementation is not None:
             return self.repr_implementation
-        from gceutils.repr import GreprRepresentationImplementation
-
-        return GreprRepresentationImplementation
+        return _DEFERRED_IMPORTS.get("GreprRepresentationImplementation") or _load_deferred_imports()["GreprRepresentationImplementation"]
 
     def make_repr_method(self):
         decorator_impl = self
@@ -166,43 +210,67 @@ class GreprDataclassImplementation:
             return
         cls.__repr__ = self.make_repr_method()
         cls.__has_grepr__ = True
+        cls.__grepr_fields__ = tuple(_field.name for _field in get_fields(cls) if _get_field_option(_field, "grepr"))
 
     def ensure_validate_path(self, path: AbstractTreePath | None) -> AbstractTreePath:
         if path is None:
-            return AbstractTreePath(start_with_dot=True)
+            return AbstractTreePath._unsafe((), True)
         return path
 
-    def validate_typed_fields(self, instance: Any, path: AbstractTreePath, type_hints: dict[str, Any]) -> None:
-        from gceutils.decorators import enforce_type
-
-        for _field in get_fields(instance):
-            options = get_field_options(_field)
-            if not options["validate_type"]:
+    def build_validate_plan(self, cls: type[Any]) -> tuple[tuple[tuple[str, Any, bool, type | None], ...], tuple[str, ...]]:
+        """
+        Resolve the type hints and field options of `cls` once.
+        Returns the (name, expected_type, require_exist, plain_type) type checks and the names of fields to call validate on.
+        `plain_type` is set when the expected type is a plain class, so a single isinstance check is enough on success.
+        """
+        type_hints = get_type_hints(cls)
+        fields = get_fields(cls)
+        type_checks = []
+        for _field in fields:
+            if not _get_field_option(_field, "validate_type"):
                 continue
             expected_type = type_hints.get(_field.name, _field.type)
-            if hasattr(instance, _field.name):
+            plain_type = expected_type if (
+                isinstance(expected_type, type) and not isinstance(expected_type, GenericAlias) and (expected_type is not Any)
+            ) else None
+            type_checks.append((_field.name, expected_type, _get_field_option(_field, "validate_require_exist"), plain_type))
+        subvalidate_checks = tuple(_field.name for _field in fields if _get_field_option(_field, "call_subvalidate"))
+        return tuple(type_checks), subvalidate_checks
+
+    def get_validate_plan(self, cls: type[Any]) -> tuple[tuple[tuple[str, Any, bool, type | None], ...], tuple[str, ...]]:
+        """Return the validation plan of `cls`, building it on first use. Subclasses get their own plan."""
+        plan = cls.__dict__.get("__validate_plan__")
+        if plan is None:
+            plan = self.build_validate_plan(cls)
+            cls.__validate_plan__ = plan
+        return plan
+
+    def validate_typed_fields(self, instance: Any, path: AbstractTreePath, type_checks: tuple[tuple[str, Any, bool, type | None], ...]) -> None:
+        enforce_type = _DEFERRED_IMPORTS.get("enforce_type") or _load_deferred_imports()["enforce_type"]
+        for name, expected_type, require_exist, plain_type in type_checks:
+            if hasattr(instance, name):
+                value = getattr(instance, name)
+                if (plain_type is not None) and isinstance(value, plain_type):
+                    continue # valid, so the field path is never needed
                 enforce_type(
-                    value=getattr(instance, _field.name),
+                    value=value,
                     expected=expected_type,
-                    path=path.add_attribute(_field.name),
+                    path=path.add_attribute(name),
                     notset_as_special=False,
                 )
-            elif options["validate_require_exist"]:
+            elif require_exist:
                 enforce_type(
                     value=NotSet,
                     expected=expected_type,
-                    path=path.add_attribute(_field.name),
+                    path=path.add_attribute(name),
                     notset_as_special=True,
                 )
 
-    def validate_subfields(self, instance: Any, path: AbstractTreePath, *args, **kwargs) -> None:
-        for _field in get_fields(instance):
-            options = get_field_options(_field)
-            if not options["call_subvalidate"]:
-                continue
-            field_value = getattr(instance, _field.name, None)
+    def validate_subfields(self, instance: Any, path: AbstractTreePath, subvalidate_checks: tuple[str, ...], *args, **kwargs) -> None:
+        for name in subvalidate_checks:
+            field_value = getattr(instance, name, None)
             if callable(getattr(field_value, "validate", None)):
-                field_value.validate(path.add_attribute(_field.name), *args, **kwargs)
+                field_value.validate(path.add_attribute(name), *args, **kwargs)
 
     def run_post_validate(self, instance: Any, path: AbstractTreePath, *args, **kwargs) -> None:
         if callable(getattr(instance, "post_validate", None)):
@@ -213,9 +281,9 @@ class GreprDataclassImplementation:
 
         def validate_method(instance, path: AbstractTreePath | None = None, *args, **kwargs) -> None:
             resolved_path = decorator_impl.ensure_validate_path(path)
-            type_hints = get_type_hints(type(instance))
-            decorator_impl.validate_typed_fields(instance, resolved_path, type_hints)
-            decorator_impl.validate_subfields(instance, resolved_path, *args, **kwargs)
+            type_checks, subvalidate_checks = decorator_impl.get_validate_plan(type(instance))
+            decorator_impl.validate_typed_fields(instance, resolved_path, type_checks)
+            decorator_impl.validate_subfields(instance, resolved_path, subvalidate_checks, *args, **kwargs)
             decorator_impl.run_post_validate(instance, resolved_path, *args, **kwargs)
 
         return validate_method
@@ -226,6 +294,12 @@ class GreprDataclassImplementation:
 
         cls.validate = self.make_validate_method()
         cls.__has_validate__ = True
+        try:
+            self.get_validate_plan(cls)
+        except (NameError, AttributeError):
+            # forward references or partially initialised modules can not be resolved yet;
+            # the plan is then built on first validate
+            pass
 
         if hasattr(cls, "__abstractmethods__"):
             abstractmethods = set(cls.__abstractmethods__)
@@ -275,6 +349,7 @@ class HasGreprValidate(Protocol):
     """
     Protocol to represent effects of @grepr_dataclass with `grepr=True` and `validate=true`.
     """
+    __slots__ = ()
 
     # Needs to be synced with arguments of grepr
     def __repr__(self, /,
@@ -300,8 +375,18 @@ class HasGreprValidate(Protocol):
 
 class NotSetType:
     """
-    An empty placeholder
+    An empty placeholder. There is only one instance: NotSet
     """
+    __slots__ = ()
+    _instance: NotSetType | None = None
+
+    def __new__(cls) -> NotSetType:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self) -> str:
+        return "NotSet" # pickle and copy resolve the module level singleton
 
     def __repr__(self) -> str:
         return "NotSet"
@@ -311,43 +396,66 @@ class NotSetType:
 
 NotSet = NotSetType()
 
-@grepr_dataclass(frozen=True, unsafe_hash=True)
+@grepr_dataclass(frozen=True, unsafe_hash=True, slots=True)
 class ATPathAttribute(HasGreprValidate):
     """
     Represents an attribute of a visit path. Immutable/Frozen and Hashable.
     """
     value: str
 
-@grepr_dataclass(frozen=True, unsafe_hash=True)
+_ATPATH_ATTR_CACHE: dict[str, tuple[ATPathAttribute]] = {}
+_ATPATH_ATTR_CACHE_MAX_SIZE = 1024
+
+def _attr_tuple(name: str) -> tuple[ATPathAttribute]:
+    """
+    Return a shared singleton tuple holding the ATPathAttribute for `name`, ready to be appended to a path tuple.
+    Attribute names repeat a lot during validation, so the items are interned.
+    """
+    item_tuple = _ATPATH_ATTR_CACHE.get(name)
+    if item_tuple is None:
+        item_tuple = (ATPathAttribute(name),)
+        if len(_ATPATH_ATTR_CACHE) < _ATPATH_ATTR_CACHE_MAX_SIZE:
+            _ATPATH_ATTR_CACHE[name] = item_tuple
+    return item_tuple
+
+@grepr_dataclass(frozen=True, unsafe_hash=True, slots=True)
 class ATPathIndexOrKey(HasGreprValidate):
     """
     Represents an index or key of a visit path. Immutable/Frozen and Hashable.
     """
     value: str
 
-@grepr_dataclass(frozen=True, unsafe_hash=True, init=False, grepr=False)
+@grepr_dataclass(frozen=True, unsafe_hash=True, init=False, grepr=False, slots=True)
 class AbstractTreePath(HasGreprValidate):
     """
     Represents a visit path inside an Abstract Object Tree. Immutable/Frozen and Hashable.
     """
-    path: tuple[ATPathAttribute | ATPathIndexOrKey, ...] = field(default_factory=tuple)
+    path: tuple[ATPathAttribute | ATPathIndexOrKey, ...] = field(default=())
     start_with_dot: bool = True
 
-    def __init__(self, path: Iterable[ATPathAttribute | ATPathIndexOrKey] = tuple(), start_with_dot: bool = True) -> None:
+    def __init__(self, path: Iterable[ATPathAttribute | ATPathIndexOrKey] = (), start_with_dot: bool = True) -> None:
         try:
-            iter(path)
+            path = tuple(path)
         except TypeError:
             raise ValueError("path must be an iterable of ATPathAttribute or ATPathIndexOrKey items")
-        if not all(isinstance(item, (ATPathAttribute, ATPathIndexOrKey)) for item in path):
+        if not all(type(item) in (ATPathAttribute, ATPathIndexOrKey) for item in path):
             raise ValueError("path must be an iterable of ATPathAttribute or ATPathIndexOrKey items")
-        self.__dict__["path"] = tuple(path)
-        self.__dict__["start_with_dot"] = start_with_dot
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "start_with_dot", start_with_dot)
+    
+    @classmethod
+    def _unsafe(cls, path: tuple[ATPathAttribute | ATPathIndexOrKey, ...], start_with_dot: bool) -> AbstractTreePath:
+        """Create a path without validation. Only for internal use with a tuple of already valid items."""
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "path", path)
+        object.__setattr__(instance, "start_with_dot", start_with_dot)
+        return instance
     
     def copy(self) -> AbstractTreePath:
         return self.__copy__()
     
     def __copy__(self) -> AbstractTreePath:
-        return AbstractTreePath(copy(self.path), start_with_dot=self.start_with_dot)
+        return AbstractTreePath._unsafe(self.path, self.start_with_dot)
     
     def add_attribute(self, attr: str) -> AbstractTreePath:
         """
@@ -355,13 +463,13 @@ class AbstractTreePath(HasGreprValidate):
         """
         if not isinstance(attr, str):
             raise ValueError("attr must be a string")
-        return AbstractTreePath(self.path + (ATPathAttribute(attr),), start_with_dot=self.start_with_dot)
+        return AbstractTreePath._unsafe(self.path + _attr_tuple(attr), self.start_with_dot)
 
     def add_index_or_key(self, index_or_key: int | str | Any) -> AbstractTreePath:
         """
         Adds an index or key to the path. Returns a new instance.
         """
-        return AbstractTreePath(self.path + (ATPathIndexOrKey(index_or_key),), start_with_dot=self.start_with_dot)
+        return AbstractTreePath._unsafe(self.path + (ATPathIndexOrKey(index_or_key),), self.start_with_dot)
     
     def extend(self, other: AbstractTreePath) -> AbstractTreePath:
         """
@@ -369,7 +477,11 @@ class AbstractTreePath(HasGreprValidate):
         """
         if not isinstance(other, AbstractTreePath):
             raise ValueError("first argument must be an AbstractTreePath")
-        return AbstractTreePath(self.path + other.path, start_with_dot=self.start_with_dot)
+        if not other.path:
+            return self # immutable, so no copy is needed
+        if not self.path:
+            return AbstractTreePath._unsafe(other.path, self.start_with_dot)
+        return AbstractTreePath._unsafe(self.path + other.path, self.start_with_dot)
     
     def go_up(self, n: int = 1) -> AbstractTreePath:
         """
@@ -383,7 +495,7 @@ class AbstractTreePath(HasGreprValidate):
         """
         Find the index of an attribute, index or key.
         """
-        if not isinstance(value, (ATPathAttribute, ATPathIndexOrKey)):
+        if (type(value) is not ATPathAttribute) and (type(value) is not ATPathIndexOrKey):
             raise ValueError("value must be an ATPathAttribute or ATPathIndexOrKey")
         return self.path.index(value)
     
@@ -398,13 +510,11 @@ class AbstractTreePath(HasGreprValidate):
     @overload
     def __getitem__(self, i: slice, /) -> AbstractTreePath: ...
     def __getitem__(self, i: SupportsIndex | slice, /) -> ATPathAttribute | ATPathIndexOrKey | AbstractTreePath:
-        if not isinstance(i, (SupportsIndex, slice)):
-            raise ValueError("first argument must be an index or slice")
-        if isinstance(i, slice):
-            new_path = self.path.__getitem__(i)
-            return AbstractTreePath(new_path, start_with_dot=self.start_with_dot)
-        else:
-            return self.path.__getitem__(i)
+        if type(i) is slice:
+            return AbstractTreePath._unsafe(self.path[i], self.start_with_dot)
+        if (type(i) is int) or hasattr(i, "__index__"):
+            return self.path[i]
+        raise ValueError("first argument must be an index or slice")
     
     def __add__(self, other: AbstractTreePath, /) -> AbstractTreePath:
         if not isinstance(other, AbstractTreePath):
@@ -412,7 +522,7 @@ class AbstractTreePath(HasGreprValidate):
         return self.extend(other)
     
     def __contains__(self, value: ATPathAttribute | ATPathIndexOrKey) -> bool:
-        if not isinstance(value, (ATPathAttribute, ATPathIndexOrKey)):
+        if (type(value) is not ATPathAttribute) and (type(value) is not ATPathIndexOrKey):
             raise ValueError("first argument must be an ATPathAttribute or ATPathIndexOrKey")
         return value in self.path
     
@@ -420,16 +530,18 @@ class AbstractTreePath(HasGreprValidate):
         return reversed(self.path)
         
     def repr_as_python_code(self) -> str:
-        path_string = ""
+        parts = []
         for item in self.path:
-            if   isinstance(item, ATPathAttribute):
-                path_string += f".{item.value}"
-            elif isinstance(item, ATPathIndexOrKey):
-                path_string += f"[{item.value!r}]"
-        if not self.start_with_dot:
-            path_string = path_string.removeprefix(".")
-            # Removes if at the start, else does nothing
-        return path_string
+            if type(item) is ATPathAttribute:
+                parts.append(".")
+                parts.append(item.value)
+            else:
+                parts.append("[")
+                parts.append(repr(item.value))
+                parts.append("]")
+        if (not self.start_with_dot) and parts and (parts[0] == "."):
+            parts[0] = "" # drop the leading dot instead of stripping it from the joined string
+        return "".join(parts)
     
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.repr_as_python_code()})"
@@ -442,37 +554,40 @@ class AbstractTreePath(HasGreprValidate):
         """
         Dynamically get a node in an arbitrary object tree by this path.
         """
+        found, result, failed_at = self._descend(tree)
+        if found:
+            return result
+        if default is not NotSet:
+            return default
+        item = self.path[failed_at]
+        kind = "attribute" if type(item) is ATPathAttribute else "index or key"
+        raise ValueError(f"Failed to get {kind} {item.value!r} of object at path {self[:failed_at]}: {result}") from result
+
+    def _descend(self, tree: Any) -> tuple[bool, Any, int]:
+        """
+        Follow this path in an arbitrary object tree without raising for inaccessible nodes.
+        Returns (True, node, -1) on success and (False, error, index of the failing item) otherwise.
+        """
         current_object = tree
-        for i, item in enumerate(self):
-            if   isinstance(item, ATPathAttribute):
-                if isinstance(current_object, dict) and (item.value == "keys()"):
-                    # keys can only be accessed with d.keys()[key_index] not d[key]
-                    current_object = list(current_object.keys())
-                    continue
-                try:
-                    current_object = getattr(current_object, item.value)
-                except (AttributeError, TypeError, Exception) as error:
-                    if default is NotSet:
-                        raise ValueError(f"Failed to get attribute {item.value!r} of object at path {self[:i]}: {error}") from error
-                    return default
-            elif isinstance(item, ATPathIndexOrKey):
-                try:
+        for i, item in enumerate(self.path):
+            try:
+                if type(item) is ATPathAttribute:
+                    if (item.value == "keys()") and isinstance(current_object, dict):
+                        # keys can only be accessed with d.keys()[key_index] not d[key]
+                        current_object = list(current_object.keys())
+                    else:
+                        current_object = getattr(current_object, item.value)
+                else:
                     current_object = current_object[item.value]
-                except (IndexError, KeyError, TypeError, Exception) as error:
-                    if default is NotSet:
-                        raise ValueError(f"Failed to get index or key {item.value!r} of object at path {self[:i]}: {error}") from error
-                    return default
-        return current_object
+            except (AttributeError, IndexError, KeyError, TypeError) as error:
+                return False, error, i
+        return True, current_object, -1
 
     def exists_in_tree(self, tree: Any) -> bool:
         """
         Checks if this path is accessible in an arbitrary object tree.
         """
-        try:
-            self.get_in_tree(tree)
-            return True
-        except ValueError:
-            return False
+        return self._descend(tree)[0]
 
     def set_in_tree(self, tree: Any, value: Any) -> None:
         """
@@ -493,7 +608,7 @@ class AbstractTreePath(HasGreprValidate):
 
 
 __all__ = [
-    "field", "update_field", "GreprDataclassImplementation", "grepr_dataclass", "HasGreprValidate",
+    "field", "GreprField", "update_field", "GreprDataclassImplementation", "grepr_dataclass", "HasGreprValidate",
     "ATPathAttribute", "ATPathIndexOrKey", "AbstractTreePath",
     "NotSetType", "NotSet",
 ]
@@ -1,20 +1,29 @@
 from __future__      import annotations
-from collections.abc import Iterable, Callable as ABCCallable, Mapping, Sequence
-from functools       import wraps
-from inspect         import signature
+from collections.abc import (
+    Iterable, Callable as ABCCallable, Mapping, MutableMapping, Sequence, MutableSequence,
+    Set as AbstractSet, MutableSet,
+)
+from functools       import lru_cache, wraps
+from inspect         import signature, Parameter, CO_VARARGS, CO_VARKEYWORDS
+from os              import environ
 from sys             import modules as sys_modules
-from types           import UnionType
+from types           import FunctionType, UnionType
 from typing          import (
     Any, Literal, Callable, Union, ParamSpec, TypeVar,
     get_origin, get_args, get_type_hints,
 )
 
-from gceutils.base import AbstractTreePath
+from gceutils.base   import AbstractTreePath, ATPathAttribute, ATPathIndexOrKey, NotSetType
+from gceutils.errors import GU_TypeValidationError
 
 
 PARAM_SPEC = ParamSpec("PARAM_SPEC")
 RETURN_T = TypeVar("RETURN_T")
 TYPE_T = TypeVar("TYPE_T", bound=type)
+# A compiled check for one annotation: validator(value, frames, condition)
+VALIDATOR = Callable[[Any, "_PathFrames", "str | None"], None]
+# Set GCEUTILS_DISABLE_TYPECHECK=1 to skip installing the enforce_argument_types wrappers, e.g. in production
+_TYPECHECK_DISABLED = environ.get("GCEUTILS_DISABLE_TYPECHECK") == "1"
 
 
 def enforce_argument_types(func: Callable[PARAM_SPEC, RETURN_T]) -> Callable[PARAM_SPEC, RETURN_T]:
@@ -35,52 +44,102 @@ def enforce_argument_types(func: Callable[PARAM_SPEC, RETURN_T]) -> Callable[PAR
     - Class methods
     - Static methods
 
+    Functions without any checkable argument annotations are returned unchanged.
+    When the environment variable GCEUTILS_DISABLE_TYPECHECK is set to "1" at import time,
+    no checks are installed and func is returned unchanged.
+
     Args:
         func: the function to wrap
 
     Raises:
         TypeError: if any argument does not match its annotated type
     """
+    if _TYPECHECK_DISABLED:
+        return func
+
     # Unwrap and rewrap classmethod/staticmethod
     
-    if isinstance(func, (classmethod, staticmethod)):
+    func_type = type(func)
+    if (func_type is classmethod) or (func_type is staticmethod):
         original_func = func.__func__
         wrapped = enforce_argument_types(original_func)
-        return type(func)(wrapped)
-
-    sig = signature(func)
+        return func_type(wrapped)
+
+    sig = None # only built once a call needs Signature.bind
+    param_names, zip_bindable = _parameter_shape(func)
+    # The first parameter of methods (self/cls) is never checked
+    skipped_name = param_names[0] if (param_names and (param_names[0] in ("self", "cls"))) else None
+
+    def compile_validators(type_hints: dict[str, Any]) -> dict[str, tuple[VALIDATOR, tuple[type, str]]]:
+        """Map each checked parameter to its validator and its precomputed path frame."""
+        validators = {}
+        for name, expected_type in type_hints.items():
+            if (name == "return") or (name == skipped_name):
+                continue
+            # Ignore TypeVar type hints
+            if isinstance(expected_type, TypeVar):
+                continue
+            validators[name] = (_get_validator(expected_type), (ATPathAttribute, name))
+        return validators
+
+    module = sys_modules.get(func.__module__)
+    globalns = None if module is None else module.__dict__
+    try:
+        type_hints = get_type_hints(func, globalns=globalns)
+    except (NameError, AttributeError):
+        # Forward references (e.g. to the class a method is defined in, or PEP 695 type parameters)
+        # and partially initialised modules during circular imports can only be resolved on the first call
+        validators = None
+    else:
+        validators = compile_validators(type_hints)
+        if not validators: # nothing to check, e.g. only self/return annotations
+            return func
 
     @wraps(func)
     def wrapper(*args: PARAM_SPEC.args, **kwargs: PARAM_SPEC.kwargs) -> RETURN_T:
-        type_hints = get_type_hints(func, globalns=sys_modules[func.__module__].__dict__)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
-        
-        skip_first = False
-        if bound_args.arguments:
-            first_name = next(iter(bound_args.arguments))
-            if first_name in ("self", "cls"):
-                skip_first = True
-
-        for i, (name, value) in enumerate(bound_args.arguments.items()):
-            if skip_first and i == 0:
-                continue
-            if name in type_hints:
-                expected_type = type_hints[name]
-                # Ignore TypeVar type hints
-                if (getattr(expected_type, "__module__", None) == "typing") and \
-                    (getattr(expected_type, "__origin__", None) is None) and \
-                    (getattr(expected_type, "__name__", None) == "TypeVar"):
-                    continue
-                if type(expected_type).__name__ == "TypeVar":
-                    continue
-                enforce_type(value, expected_type, path=AbstractTreePath(start_with_dot=False).add_attribute(name))
+        nonlocal validators, sig
+        if validators is None:
+            validators = compile_validators(get_type_hints(func, globalns=globalns))
+        if zip_bindable and (not kwargs) and (len(args) == len(param_names)):
+            arguments = zip(param_names, args)
+        else:
+            if sig is None:
+                sig = signature(func)
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            arguments = bound_args.arguments.items()
+
+        frames = None # one frame stack per call, shared by all checked arguments
+        for name, value in arguments:
+            checker = validators.get(name)
+            if checker is not None:
+                validator, frame = checker
+                if frames is None:
+                    frames = _PathFrames(_ARGUMENT_ROOT)
+                frames.append(frame)
+                validator(value, frames, None)
+                frames.pop()
 
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _parameter_shape(func: Callable[..., Any]) -> tuple[tuple[str, ...], bool]:
+    """
+    Return the names of the positional parameters of func and whether func has no other parameters.
+    Plain functions are read from their code object; anything else (e.g. wrappers exposing __wrapped__) via inspect.signature.
+    """
+    if (type(func) is FunctionType) and not hasattr(func, "__wrapped__") and not hasattr(func, "__signature__"):
+        code = func.__code__
+        only_positional = (code.co_kwonlyargcount == 0) and not (code.co_flags & (CO_VARARGS | CO_VARKEYWORDS))
+        return code.co_varnames[:code.co_argcount], only_positional
+    parameters = signature(func).parameters.values()
+    positional_names = tuple(
+        param.name for param in parameters if param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    )
+    return positional_names, len(positional_names) == len(parameters)
+
 def _is_union(tp: object) -> bool:
     return (
         get_origin(tp) is Union  # typing.Union[int, str]
@@ -94,11 +153,14 @@ def _repr_type(t: type | Any, notset_as_special: bool = True) -> str:
         t: The type to represent
         notset_as_special: If True, represent NotSetType as '<not set>' instead of the class name
     """
-    from gceutils.base import NotSetType
-    
     if not isinstance(t, type):
         # Handle typing constructs
         return str(t)
+    return _repr_class(t, notset_as_special)
+
+@lru_cache(maxsize=1024)
+def _repr_class(t: type, notset_as_special: bool) -> str:
+    """Cached part of _repr_type for classes, which are hashable and usually live for the whole program."""
     if notset_as_special and t is NotSetType:
         return "<not set>"
     if t.__module__ == "builtins":
@@ -112,182 +174,221 @@ def _repr_type(t: type | Any, notset_as_special: bool = True) -> str:
     else:
         return f"{t.__module__}.{t.__name__}"
 
-def enforce_type(value: Any, expected: Any, path: AbstractTreePath | None = None, condition: str | None = None, notset_as_special: bool = True) -> None:
+class _PathFrames(list):
     """
-    Recursively checks that a given value matches the expected type.
-    Runtime type enforcement that supports TypeVar, Union, Optional,
-    type[T], list[T], tuple[T,...], dict[K,V], set[T], frozenset[T],
-    Iterable[T], Sequence[T], Mapping[K,V], Callable, and Literal.
-    Raises GU_TypeValidationError on mismatch.
-
-    Args:
-        value: the actual value passed to the function
-        expected: The type annotation from the function signature
-        path: AbstractTreePath for tracking location in nested data structures
-        condition: Optional context for why this type is required (e.g., "because it's an instance of X")
-        notset_as_special: If True, represent NotSetType as "<not set>" instead of the class name in error messages
-
-    Raises:
-        GU_TypeValidationError: If the value does not match the expected type
+    The path to the value currently being validated, as a stack of (path item class, value) frames on top of a root path.
+    Validators push and pop frames while recursing; an AbstractTreePath is only built when an error is raised.
     """
-    from gceutils.errors import GU_TypeValidationError
-    
-    if path is None:
-        path = AbstractTreePath()
-    
-    # --- Handle Any ---
-    if expected is Any:
-        return
-
-    # --- Handle TypeVar ---
-    if isinstance(expected, TypeVar):
-        if expected.__bound__ is not None:
-            return enforce_type(value, expected.__bound__, path, condition)
-        # Unbound TypeVar -> accept anything
-        return
+    __slots__ = ("root",)
 
-    origin = get_origin(expected)
-    args = get_args(expected)
+    def __init__(self, root: AbstractTreePath, frames: Iterable[tuple[type, Any]] = ()) -> None:
+        super().__init__(frames)
+        self.root = root
 
-    # --- Handle Union / Optional ---
-    if _is_union(expected):
-        # handle both typing.Union[...] and PEP 604 int | str
-        arms = get_args(expected) if get_args(expected) else expected.__args__
-        for arm in arms:
-            try:
-                enforce_type(value, arm, path, condition, notset_as_special)
-                return
-            except GU_TypeValidationError:
-                continue
-        raise GU_TypeValidationError(
-            path,
-            f"must be one of types {_repr_type(expected, notset_as_special)} not {_repr_type(type(value), notset_as_special)}",
-            condition
+    def to_path(self) -> AbstractTreePath:
+        """Materialize the current frames into an AbstractTreePath."""
+        return AbstractTreePath._unsafe(
+            self.root.path + tuple(item_cls(item_value) for item_cls, item_value in self),
+            self.root.start_with_dot,
         )
 
+_KEYS_FRAME = (ATPathAttribute, "keys()")
+_ARGUMENT_ROOT = AbstractTreePath(start_with_dot=False)
+
+def _accept_any(value: Any, frames: _PathFrames, condition: str | None) -> None:
+    """Validator for Any and unbound TypeVars."""
+    return None
+
+@lru_cache(maxsize=1024)
+def _cached_validator(expected_class: type, expected: Any, notset_as_special: bool) -> VALIDATOR:
+    """
+    Cached part of _get_validator for hashable annotations.
+    Keyed by the annotation class too, because e.g. typing.Union[int, str] == int | str but both are represented differently.
+    """
+    return _compile_validator(expected, notset_as_special)
+
+def _get_validator(expected: Any, notset_as_special: bool = True) -> VALIDATOR:
+    """Return the compiled validator for a type annotation, compiling it on first use."""
+    try:
+        hash(expected)
+    except TypeError: # unhashable annotation
+        return _compile_validator(expected, notset_as_special)
+    return _cached_validator(type(expected), expected, notset_as_special)
+
+def _plain_element_class(elem_t: Any, elem_validator: VALIDATOR) -> type | None:
+    """Return the class an element can be checked against with one isinstance call, if there is one."""
+    if elem_validator is _accept_any:
+        return object
+    if elem_t.__class__ is type:
+        return elem_t
+    return None
+
+def _compile_elements(elem_t: Any, notset_as_special: bool) -> Callable[[Iterable[Any], _PathFrames, "str | None"], None]:
+    """
+    Compile the check applied to each item of a homogeneous container, reporting failures by index.
+    Items with a plain class annotation are checked inline, without a call or path frame per item.
+    """
+    elem_validator = _get_validator(elem_t, notset_as_special)
+    plain_elem_t = _plain_element_class(elem_t, elem_validator)
+    if plain_elem_t is object:
+        def validate_elements(items: Iterable[Any], frames: _PathFrames, condition: str | None) -> None:
+            return None
+    elif plain_elem_t is not None:
+        def validate_elements(items: Iterable[Any], frames: _PathFrames, condition: str | None) -> None:
+            for i, item in enumerate(items):
+                if not isinstance(item, plain_elem_t):
+                    frames.append((ATPathIndexOrKey, i))
+                    elem_validator(item, frames, condition) # raises
+    else:
+        def validate_elements(items: Iterable[Any], frames: _PathFrames, condition: str | None) -> None:
+            for i, item in enumerate(items):
+                frames.append((ATPathIndexOrKey, i))
+                elem_validator(item, frames, condition)
+                frames.pop()
+    return validate_elements
+
+def _compile_type_subclass(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a type[T] check."""
+    target = args[0] if args else object
+    # if the inner arg is a TypeVar, reduce to its bound
+    if isinstance(target, TypeVar):
+        target = target.__bound__ or object
+    if _is_union(target):
+        targets = tuple(get_args(target))
+    else:
+        targets = (target,)
 
-    # --- Handle type[T] ---
-    if origin is type:
+    def validate_type(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if not isinstance(value, type):
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be a class (type[T]) not {_repr_type(type(value), notset_as_special)}",
                 condition
             )
-        target = args[0] if args else object
-        # if the inner arg is a TypeVar, reduce to its bound
-        if isinstance(target, TypeVar):
-            target = target.__bound__ or object
-        if _is_union(target):
-            targets = tuple(get_args(target))
-        else:
-            targets = (target,)
         if target is not object and not issubclass(value, targets):
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be a subclass of {targets} not {value}",
                 condition
             )
-        return
-
-    # --- Handle dict[K,V] ---
-    if origin is dict:
-        key_t = args[0] if len(args) >= 1 else Any
-        val_t = args[1] if len(args) >= 2 else Any
-        if not isinstance(value, dict):
+    return validate_type
+
+def _compile_mapping(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a dict[K, V], Mapping[K, V] or MutableMapping[K, V] check."""
+    key_t = args[0] if len(args) >= 1 else Any
+    val_t = args[1] if len(args) >= 2 else Any
+    key_validator = _get_validator(key_t, notset_as_special)
+    val_validator = _get_validator(val_t, notset_as_special)
+    container_name = f"a {origin.__name__}"
+    # Plain class keys (e.g. str) are checked inline; the keys() path is only built for an error
+    plain_key_t = key_t if key_t.__class__ is type else None
+    # Plain class values are checked inline too; their validator is only called to raise the error
+    plain_val_t = _plain_element_class(val_t, val_validator)
+
+    def validate_mapping(value: Any, frames: _PathFrames, condition: str | None) -> None:
+        if not isinstance(value, origin):
             raise GU_TypeValidationError(
-                path,
-                f"must be a dict not {_repr_type(type(value), notset_as_special)}",
+                frames.to_path(),
+                f"must be {container_name} not {_repr_type(type(value), notset_as_special)}",
                 condition
             )
-        keys_path = path.add_attribute("keys()")
+        if plain_key_t is not None:
+            for k, v in value.items():
+                if not isinstance(k, plain_key_t):
+                    index = next(i for i, other in enumerate(value) if other is k)
+                    frames.append(_KEYS_FRAME)
+                    frames.append((ATPathIndexOrKey, index))
+                    key_validator(k, frames, condition) # raises
+                if (plain_val_t is None) or not isinstance(v, plain_val_t):
+                    frames.append((ATPathIndexOrKey, k))
+                    val_validator(v, frames, condition)
+                    frames.pop()
+            return
         for i, (k, v) in enumerate(value.items()):
-            enforce_type(k, key_t, keys_path.add_index_or_key(i), condition, notset_as_special)
-            enforce_type(v, val_t, path.add_index_or_key(k), condition, notset_as_special)
-        return
+            frames.append(_KEYS_FRAME)
+            frames.append((ATPathIndexOrKey, i))
+            key_validator(k, frames, condition)
+            del frames[-2:]
+            if (plain_val_t is None) or not isinstance(v, plain_val_t):
+                frames.append((ATPathIndexOrKey, k))
+                val_validator(v, frames, condition)
+                frames.pop()
+    return validate_mapping
+
+def _compile_tuple(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a tuple[T, ...] or fixed tuple[T1, T2, ...] check."""
+    if len(args) == 2 and args[1] is Ellipsis:  # tuple[T, ...]
+        validate_elements = _compile_elements(args[0], notset_as_special)
+
+        def validate_tuple(value: Any, frames: _PathFrames, condition: str | None) -> None:
+            if not isinstance(value, tuple):
+                raise GU_TypeValidationError(
+                    frames.to_path(),
+                    f"must be a tuple not {_repr_type(type(value), notset_as_special)}",
+                    condition
+                )
+            validate_elements(value, frames, condition)
+        return validate_tuple
+
+    elem_validators = tuple(_get_validator(elem_t, notset_as_special) for elem_t in args)
 
-    # --- Handle tuple[T,...] or fixed tuple ---
-    if origin is tuple:
+    def validate_fixed_tuple(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if not isinstance(value, tuple):
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be a tuple not {_repr_type(type(value), notset_as_special)}",
                 condition
             )
-        if len(args) == 2 and args[1] is Ellipsis:  # tuple[T, ...]
-            elem_t = args[0]
-            for i, item in enumerate(value):
-                enforce_type(item, elem_t, path.add_index_or_key(i), condition, notset_as_special)
-        elif args:  # tuple[T1, T2, ...]
-            if len(value) != len(args):
-                raise GU_TypeValidationError(
-                    path,
-                    f"must be a tuple of length {len(args)} not length {len(value)}",
-                    condition
-                )
-            for i, (item, elem_t) in enumerate(zip(value, args)):
-                enforce_type(item, elem_t, path.add_index_or_key(i), condition, notset_as_special)
-        return
-
-    # --- Handle list[T], set[T], frozenset[T] ---
-    if origin in (list, set, frozenset):
+        if not elem_validators: # bare tuple
+            return
+        if len(value) != len(elem_validators):
+            raise GU_TypeValidationError(
+                frames.to_path(),
+                f"must be a tuple of length {len(elem_validators)} not length {len(value)}",
+                condition
+            )
+        for i, (item, elem_validator) in enumerate(zip(value, elem_validators)):
+            frames.append((ATPathIndexOrKey, i))
+            elem_validator(item, frames, condition)
+            frames.pop()
+    return validate_fixed_tuple
+
+def _compile_collection(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a list[T], set[T], frozenset[T], Sequence[T], AbstractSet[T] (or mutable variant) check."""
+    validate_elements = _compile_elements(args[0] if args else Any, notset_as_special)
+    container_name = f"a {origin.__name__}"
+
+    def validate_collection(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if not isinstance(value, origin):
             raise GU_TypeValidationError(
-                path,
-                f"must be a {origin.__name__} not {_repr_type(type(value), notset_as_special)}",
+                frames.to_path(),
+                f"must be {container_name} not {_repr_type(type(value), notset_as_special)}",
                 condition
             )
-        elem_t = args[0] if args else Any
-        for i, item in enumerate(value):
-            enforce_type(item, elem_t, path.add_index_or_key(i), condition, notset_as_special)
-        return
+        validate_elements(value, frames, condition)
+    return validate_collection
 
-    # --- Handle Callable ---
-    if origin is ABCCallable or (origin is None and expected is ABCCallable):
+def _compile_callable(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a Callable check."""
+    def validate_callable(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if not callable(value):
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be Callable not non-callable {_repr_type(type(value), notset_as_special)}",
                 condition
             )
         # Note: We don't validate argument/return types for Callable[[int], str]
         # as that would require runtime signature inspection
-        return
+    return validate_callable
 
-    # --- Handle Mapping[K, V] ---
-    if origin is Mapping:
-        key_t = args[0] if len(args) >= 1 else Any
-        val_t = args[1] if len(args) >= 2 else Any
-        if not isinstance(value, Mapping):
-            raise GU_TypeValidationError(
-                path,
-                f"must be a Mapping not {_repr_type(type(value), notset_as_special)}",
-                condition
-            )
-        keys_path = path.add_attribute("keys()")
-        for i, (k, v) in enumerate(value.items()):
-            enforce_type(k, key_t, keys_path.add_index_or_key(i), condition, notset_as_special)
-            enforce_type(v, val_t, path.add_index_or_key(k), condition, notset_as_special)
-        return
+def _compile_iterable(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile an Iterable[T] check (elements of str/bytes and one-shot iterators are not checked)."""
+    validate_elements = _compile_elements(args[0] if args else Any, notset_as_special)
 
-    # --- Handle Sequence[T] ---
-    if origin is Sequence:
-        if not isinstance(value, Sequence):
-            raise GU_TypeValidationError(
-                path,
-                f"must be a Sequence not {_repr_type(type(value), notset_as_special)}",
-                condition
-            )
-        elem_t = args[0] if args else Any
-        for i, item in enumerate(value):
-            enforce_type(item, elem_t, path.add_index_or_key(i), condition, notset_as_special)
-        return
-
-    # --- Handle Iterable[T] (excluding str/bytes to avoid char-by-char validation) ---
-    if origin is Iterable:
+    def validate_iterable(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if not isinstance(value, Iterable):
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be an Iterable not {_repr_type(type(value), notset_as_special)}",
                 condition
             )
@@ -295,57 +396,159 @@ def enforce_type(value: Any, expected: Any, path: AbstractTreePath | None = None
         # for element-wise type checking
         if isinstance(value, (str, bytes)):
             return
-        elem_t = args[0] if args else Any
-        for i, item in enumerate(value):
-            enforce_type(item, elem_t, path.add_index_or_key(i), condition, notset_as_special)
-        return
+        # Iterators and generators have no length; walking them would consume them for the caller
+        if not hasattr(type(value), "__len__"):
+            return
+        validate_elements(value, frames, condition)
+    return validate_iterable
 
-    # --- Handle Literal[V, ...] ---
-    if origin is Literal:
+def _compile_literal(expected: Any, origin: Any, args: tuple[Any, ...], notset_as_special: bool) -> VALIDATOR:
+    """Compile a Literal[V, ...] check."""
+    def validate_literal(value: Any, frames: _PathFrames, condition: str | None) -> None:
         if value not in args:
             raise GU_TypeValidationError(
-                path,
+                frames.to_path(),
                 f"must be one of Literal{args} not {value!r}",
                 condition
             )
-        return
+    return validate_literal
+
+# get_origin() maps typing aliases (typing.Sequence, typing.Dict, ...) to these builtin and collections.abc origins
+_MAPPING_ORIGINS = (dict, Mapping, MutableMapping)
+_COLLECTION_ORIGINS = (list, set, frozenset, Sequence, MutableSequence, AbstractSet, MutableSet)
+
+# Compilers for parameterized annotations, looked up by get_origin(expected)
+_ORIGIN_COMPILERS: dict[Any, Callable[[Any, Any, tuple[Any, ...], bool], VALIDATOR]] = {
+    type: _compile_type_subclass,
+    tuple: _compile_tuple,
+    ABCCallable: _compile_callable,
+    Iterable: _compile_iterable,
+    Literal: _compile_literal,
+    **dict.fromkeys(_MAPPING_ORIGINS, _compile_mapping),
+    **dict.fromkeys(_COLLECTION_ORIGINS, _compile_collection),
+}
+
+def _compile_validator(expected: Any, notset_as_special: bool) -> VALIDATOR:
+    """
+    Partially evaluate enforce_type for one annotation.
+    All dispatch on the annotation happens here once; the returned validator(value, frames, condition) only checks the value.
+    """
+    # --- Handle Any ---
+    if expected is Any:
+        return _accept_any
+
+    # --- Handle TypeVar ---
+    if isinstance(expected, TypeVar):
+        if expected.__bound__ is not None:
+            return _get_validator(expected.__bound__)
+        # Unbound TypeVar -> accept anything
+        return _accept_any
+
+    # --- Handle Union / Optional ---
+    if _is_union(expected):
+        # handle both typing.Union[...] and PEP 604 int | str
+        arms = get_args(expected) if get_args(expected) else expected.__args__
+        # Plain class arms are checked together with one isinstance call, only the others need a validator
+        plain_arms = tuple(arm for arm in arms if arm.__class__ is type)
+        arm_validators = tuple(_get_validator(arm, notset_as_special) for arm in arms if arm.__class__ is not type)
+        expected_repr = _repr_type(expected, notset_as_special)
+
+        def validate_union(value: Any, frames: _PathFrames, condition: str | None) -> None:
+            if isinstance(value, plain_arms):
+                return
+            depth = len(frames)
+            for arm_validator in arm_validators:
+                try:
+                    arm_validator(value, frames, condition)
+                    return
+                except GU_TypeValidationError:
+                    del frames[depth:] # drop the frames left behind by the failed arm
+                    continue
+            raise GU_TypeValidationError(
+                frames.to_path(),
+                f"must be one of types {expected_repr} not {_repr_type(type(value), notset_as_special)}",
+                condition
+            )
+        return validate_union
+
+    origin = get_origin(expected)
+    compiler = _ORIGIN_COMPILERS.get(origin)
+    if compiler is not None:
+        return compiler(expected, origin, get_args(expected), notset_as_special)
 
     # --- Fallback: plain class or special typing objects ---
     if origin is None:
+        # The bare Callable ABC only needs to be callable
+        if expected is ABCCallable:
+            return _compile_callable(expected, origin, (), notset_as_special)
+
         # For a class, check isinstance
         if isinstance(expected, type):
-            if not isinstance(value, expected):
-                raise GU_TypeValidationError(
-                    path,
-                    f"must be of type {_repr_type(expected, notset_as_special)} not {_repr_type(type(value), notset_as_special)}",
-                    condition
-                )
-        else:
-            # For other typing constructs, like NewType, etc.
-            try:
+            expected_repr = _repr_type(expected, notset_as_special)
+
+            def validate_class(value: Any, frames: _PathFrames, condition: str | None) -> None:
                 if not isinstance(value, expected):
                     raise GU_TypeValidationError(
-                        path,
-                        f"must be of type {expected} not {_repr_type(type(value), notset_as_special)}",
+                        frames.to_path(),
+                        f"must be of type {expected_repr} not {_repr_type(type(value), notset_as_special)}",
                         condition
                     )
+            return validate_class
+
+        # For other typing constructs, like NewType, etc.
+        expected_repr = str(expected)
+
+        def validate_other(value: Any, frames: _PathFrames, condition: str | None) -> None:
+            try:
+                matches = isinstance(value, expected)
             except TypeError:
-                # If isinstance fails (e.g., for NewType), raise error
+                # If isinstance fails (e.g., for NewType), treat it as a mismatch
+                matches = False
+            if not matches:
                 raise GU_TypeValidationError(
-                    path,
-                    f"must be of type {expected} not {_repr_type(type(value), notset_as_special)}",
+                    frames.to_path(),
+                    f"must be of type {expected_repr} not {_repr_type(type(value), notset_as_special)}",
                     condition
                 )
-        return
+        return validate_other
 
     # --- Last fallback: ignore parameterization, just check origin ---
-    if not isinstance(value, origin):
-        origin_name = getattr(origin, "__name__", str(origin))
-        raise GU_TypeValidationError(
-            path,
-            f"must be of type {origin_name} not {_repr_type(type(value), notset_as_special)}",
-            condition
-        )
+    origin_name = getattr(origin, "__name__", str(origin))
+
+    def validate_origin(value: Any, frames: _PathFrames, condition: str | None) -> None:
+        if not isinstance(value, origin):
+            raise GU_TypeValidationError(
+                frames.to_path(),
+                f"must be of type {origin_name} not {_repr_type(type(value), notset_as_special)}",
+                condition
+            )
+    return validate_origin
+
+def enforce_type(value: Any, expected: Any, path: AbstractTreePath | None = None, condition: str | None = None, notset_as_special: bool = True) -> None:
+    """
+    Recursively checks that a given value matches the expected type.
+    Runtime type enforcement that supports TypeVar, Union, Optional,
+    type[T], list[T], tuple[T,...], dict[K,V], set[T], frozenset[T],
+    Iterable[T], Sequence[T], Mapping[K,V], their mutable and Set ABC variants,
+    Callable, and Literal.
+    Raises GU_TypeValidationError on mismatch.
+    The checks for each annotation are compiled once and cached, see _compile_validator.
+
+    Args:
+        value: the actual value passed to the function
+        expected: The type annotation from the function signature
+        path: AbstractTreePath for tracking location in nested data structures
+        condition: Optional context for why this type is required (e.g., "because it's an instance of X")
+        notset_as_special: If True, represent NotSetType as "<not set>" instead of the class name in error messages
+
+    Raises:
+        GU_TypeValidationError: If the value does not match the expected type
+    """
+    # Plain classes are the most common annotation: one isinstance check, no path or validator lookup
+    if (expected.__class__ is type) and isinstance(value, expected):
+        return
+    frames = _PathFrames(AbstractTreePath() if path is None else path)
+    _get_validator(expected, notset_as_special)(value, frames, condition)
 
 
 __all__ = ["enforce_argument_types", "enforce_type"]
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from copy       import copy, deepcopy
-from typing     import Generic, Iterable, Iterator, NoReturn, TypeVar
+from collections.abc import Collection, Set as AbstractSet
+from copy            import deepcopy
+from sys             import intern
+from typing          import Any, Generic, Iterable, Iterator, NoReturn, TypeVar
 
 from gceutils.decorators import enforce_argument_types
 
@@ -9,36 +11,146 @@ _K1 =  TypeVar("_K1")
 _K2 =  TypeVar("_K2")
 _V  =  TypeVar("_V")
 
+_MISSING = object()
+
+# gceutils.repr imports this module, so grepr is imported on first use
+_DEFERRED_IMPORTS: dict[str, Any] = {}
+
+def _load_deferred_imports() -> dict[str, Any]:
+    from gceutils.repr import grepr
+
+    _DEFERRED_IMPORTS["grepr"] = grepr
+    return _DEFERRED_IMPORTS
+
+class _RecordView:
+    """Base of the sized, re-iterable views over the (key2, value) records of a DualKeyDict."""
+    __slots__ = ("_fwd",)
+
+    def __init__(self, fwd: dict[Any, tuple[Any, Any]], /) -> None:
+        self._fwd = fwd
+
+    def __len__(self) -> int:
+        return len(self._fwd)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+class _KeyPairsView(_RecordView, AbstractSet):
+    """View of (key1, key2) tuples, like dict.items()."""
+    __slots__ = ()
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[Any]) -> set[Any]:
+        return set(iterable)
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        for key1, (key2, _) in self._fwd.items():
+            yield (key1, key2)
+
+    def __contains__(self, item: object) -> bool:
+        if not (isinstance(item, tuple) and len(item) == 2):
+            return False
+        key1, key2 = item
+        record = self._fwd.get(key1)
+        return (record is not None) and (record[0] is key2 or record[0] == key2)
+
+class _Key1ItemsView(_RecordView, AbstractSet):
+    """View of (key1, value) tuples, like dict.items()."""
+    __slots__ = ()
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[Any]) -> set[Any]:
+        return set(iterable)
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        for key1, (_, value) in self._fwd.items():
+            yield (key1, value)
+
+    def __contains__(self, item: object) -> bool:
+        if not (isinstance(item, tuple) and len(item) == 2):
+            return False
+        key1, value = item
+        record = self._fwd.get(key1)
+        return (record is not None) and (record[1] is value or record[1] == value)
+
+class _ValuesView(_RecordView, Collection):
+    """View of the values, like dict.values()."""
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, value in self._fwd.values():
+            yield value
+
+    def __contains__(self, value: object) -> bool:
+        return any(stored is value or stored == value for _, stored in self._fwd.values())
+
 class DualKeyDict(Generic[_K1, _K2, _V]):
     """
     A custom dictionary system, which allows access by key1 or key2
     """
-    
+    # The per-entry methods only have TypeVar annotations and the merge methods use PEP 695 type parameters,
+    # which get_type_hints can not resolve on Python 3.12, so neither is wrapped with enforce_argument_types
+    # _fwd maps key1 to its (key2, value) record, _rev maps key2 back to key1
+    __slots__ = ("_fwd", "_rev")
     
     @enforce_argument_types
     def __init__(self, iterable: dict[tuple[_K1, _K2], _V] | None = None, /) -> None:
         """Initialize a DualKeyDict from an optional dictionary of (key1, key2): value mappings."""
-        self._values  : dict[_K1, _V ] = {}
-        self._k2_to_k1: dict[_K2, _K1] = {}
-        self._k1_to_k2: dict[_K1, _K2] = {}
+        self._fwd: dict[_K1, tuple[_K2, _V]] = {}
+        self._rev: dict[_K2, _K1] = {}
         if iterable is not None:
-            for keys, value in iterable.items():
-                key1, key2 = keys
-                self.set(key1, key2, value)
+            self._fill(iterable)
     
-    @enforce_argument_types
     @classmethod
+    def from_validated_mapping(cls, mapping: dict[tuple[_K1, _K2], _V], /) -> DualKeyDict[_K1, _K2, _V]:
+        """
+        Create a DualKeyDict from a trusted dictionary of (key1, key2): value mappings, without argument type checks.
+        Conflicting keys are detected once after filling instead of per entry. Raises ValueError on conflicts.
+        """
+        new = DualKeyDict.__new__(DualKeyDict)
+        new._fwd = {}
+        new._rev = {}
+        new._fill(mapping)
+        return new
+    
+    def _fill(self, mapping: dict[tuple[_K1, _K2], _V]) -> None:
+        """Add all entries of a (key1, key2): value mapping to this empty DualKeyDict."""
+        fwd = self._fwd
+        rev = self._rev
+        for (key1, key2), value in mapping.items():
+            if type(key1) is str:
+                key1 = intern(key1)
+            if type(key2) is str:
+                key2 = intern(key2)
+            fwd[key1] = (key2, value)
+            rev[key2] = key1
+        # The pairs in mapping are unique, so a shared key1 or key2 shows up as a size difference
+        if (len(fwd) != len(mapping)) or (len(rev) != len(mapping)):
+            fwd.clear()
+            rev.clear()
+            for (key1, key2), value in mapping.items():
+                self.set(key1, key2, value) # raises the precise ValueError
+    
+    @classmethod
+    @enforce_argument_types
     def from_single_key_value(cls, iterable: Iterable[tuple[_K1, _V]], /) -> DualKeyDict[_K1, _K1, _V]:
         """Create a DualKeyDict where both key1 and key2 are the same."""
-        return DualKeyDict({
-            (key, key): value for key, value in iterable
-        })
+        # Equal keys can never conflict, so the dicts are filled directly
+        new = DualKeyDict.__new__(DualKeyDict)
+        new._fwd = fwd = {}
+        new._rev = rev = {}
+        for key, value in iterable:
+            if type(key) is str:
+                key = intern(key)
+            fwd[key] = (key, value)
+            rev[key] = key
+        return new
     
-    @enforce_argument_types
     @classmethod
+    @enforce_argument_types
     def from_both_keys(cls, iterable: Iterable[tuple[_K1, _K2]], value: _V, /) -> DualKeyDict[_K1, _K2, _V]:
         """Create a DualKeyDict where all entries share the same value."""
-        return DualKeyDict({
+        return DualKeyDict.from_validated_mapping({
             (key1, key2): value for key1, key2 in iterable
         })
     
@@ -50,10 +162,9 @@ class DualKeyDict(Generic[_K1, _K2, _V]):
     
     def __copy__(self) -> DualKeyDict[_K1, _K2, _V]:
         """Create a shallow copy of this DualKeyDict."""
-        new = DualKeyDict()
-        new._values   = copy(self._values)
-        new._k2_to_k1 = copy(self._k2_to_k1)
-        new._k1_to_k2 = copy(self._k1_to_k2)
+        new = DualKeyDict.__new__(DualKeyDict) # skip the checked __init__
+        new._fwd = self._fwd.copy()
+        new._rev = self._rev.copy()
         return new
     
     def deepcopy(self) -> DualKeyDict[_K1, _K2, _V]:
@@ -62,139 +173,126 @@ class DualKeyDict(Generic[_K1, _K2, _V]):
 
 
     # Value Update methods
-    @enforce_argument_types
     def set(self, key1: _K1, key2: _K2, value: _V) -> None:
         """Set a value with both key1 and key2. Raises ValueError if either key already exists with a different partner key."""
-        has_key1 = self.has_key1(key1)
-        has_key2 = self.has_key2(key2)
+        # Interned str keys make later lookups with equal (interned) strings hit the identity fast path
+        if type(key1) is str:
+            key1 = intern(key1)
+        if type(key2) is str:
+            key2 = intern(key2)
+        record = self._fwd.get(key1) # records are tuples, so None means missing
+        real_key1 = self._rev.get(key2, _MISSING)
         
-        if  has_key1 and not(has_key2):
-            real_key2 = self.get_key2_for_key1(key1)
-            raise ValueError(f"key1 {key1!r} already exists with different key2 {real_key2!r}")
-        elif has_key2 and not(has_key1):
-            real_key1 = self.get_key1_for_key2(key2)
-            raise ValueError(f"key2 {key2!r} already exists with different key1 {real_key1!r}")
-        elif has_key1 and (self.get_key2_for_key1(key1) != key2):
-            real_key2 = self.get_key2_for_key1(key1)
-            raise ValueError(f"key1 {key1!r} exists with different key2 {real_key2!r}")
+        if record is None:
+            if real_key1 is not _MISSING:
+                raise ValueError(f"key2 {key2!r} already exists with different key1 {real_key1!r}")
+        elif real_key1 is _MISSING:
+            raise ValueError(f"key1 {key1!r} already exists with different key2 {record[0]!r}")
+        elif record[0] != key2:
+            raise ValueError(f"key1 {key1!r} exists with different key2 {record[0]!r}")
             
-        self._values  [key1] = value
-        self._k2_to_k1[key2] = key1
-        self._k1_to_k2[key1] = key2
+        self._fwd[key1] = (key2, value)
+        self._rev[key2] = key1
     
-    @enforce_argument_types
     def update_by_key1(self, key1: _K1, value: _V) -> None:
         """Update the value for an existing key1. Raises KeyError if key1 does not exist."""
-        if not self.has_key1(key1):
-            raise KeyError("`update_by_key1` can not be used to add a new entry. Please use `set` instead")
-        self._values[key1] = value
+        try:
+            key2 = self._fwd[key1][0]
+        except KeyError: pass
+        else:
+            self._fwd[key1] = (key2, value)
+            return
+        raise KeyError("`update_by_key1` can not be used to add a new entry. Please use `set` instead")
 
-    @enforce_argument_types
     def update_by_key2(self, key2: _K2, value: _V) -> None:
         """Update the value for an existing key2. Raises KeyError if key2 does not exist."""
-        if not self.has_key2(key2):
-            raise KeyError("`update_by_key2` can not be used to add a new entry. Please use `set` instead")
-        key1 = self.get_key1_for_key2(key2)
-        self._values[key1] = value
+        try:
+            key1 = self._rev[key2]
+        except KeyError: pass
+        else:
+            self._fwd[key1] = (key2, value)
+            return
+        raise KeyError("`update_by_key2` can not be used to add a new entry. Please use `set` instead")
     
-    @enforce_argument_types
     def update[_ARG_K1, _ARG_K2, _ARG_V](self, value: DualKeyDict[_ARG_K1, _ARG_K2, _ARG_V], /) -> DualKeyDict[_K1|_ARG_K1, _K2|_ARG_K2, _V|_ARG_V]:
         """Merge another DualKeyDict into this one. Raises ValueError if keys conflict."""
+        if not isinstance(value, DualKeyDict):
+            raise TypeError(f"Can only update a DualKeyDict with another DualKeyDict, not {type(value).__name__!r}")
         return self.__ior__(value)
     
     def clear(self) -> None:
         """Remove all entries from the dictionary."""
-        self._values  : dict[_K1, _V ] = {}
-        self._k2_to_k1: dict[_K2, _K1] = {}
-        self._k1_to_k2: dict[_K1, _K2] = {}
+        self._fwd: dict[_K1, tuple[_K2, _V]] = {}
+        self._rev: dict[_K2, _K1] = {}
 
 
     # Value Access methods
-    @enforce_argument_types
     def get_by_key1(self, key1: _K1) -> _V:
         """Get the value associated with key1. Raises KeyError if key1 does not exist."""
-        try:
-            return self._values[key1]
-        except KeyError: pass
-        raise KeyError(f"key1 {key1!r} does not exist")
+        record = self._fwd.get(key1)
+        if record is None:
+            raise KeyError(f"key1 {key1!r} does not exist")
+        return record[1]
 
-    @enforce_argument_types
     def get_by_key2(self, key2: _K2) -> _V:
         """Get the value associated with key2. Raises KeyError if key2 does not exist."""
-        key1 = self.get_key1_for_key2(key2) # we can just let a KeyError raise and not do it ourselves
-        return self._values[key1]
+        key1 = self._rev.get(key2, _MISSING)
+        if key1 is _MISSING:
+            raise KeyError(f"key2 {key2!r} does not exist")
+        return self._fwd[key1][1]
 
-    @enforce_argument_types
     def get_by_key1_with_default[_ARG](self, key1: _K1, default: _ARG) -> _V | _ARG:
         """Get the value associated with key1, or return default if key1 does not exist."""
-        try:
-            return self.get_by_key1(key1)
-        except KeyError:
-            return default
+        record = self._fwd.get(key1)
+        return default if record is None else record[1]
 
-    @enforce_argument_types
     def get_by_key2_with_default[_ARG](self, key2: _K2, default: _ARG) -> _V | _ARG:
         """Get the value associated with key2, or return default if key2 does not exist."""
-        try:
-            return self.get_by_key2(key2)
-        except KeyError:
-            return default
+        key1 = self._rev.get(key2, _MISSING)
+        return default if key1 is _MISSING else self._fwd[key1][1]
 
     
     # Value Delete methods
-    @enforce_argument_types
     def delete_by_key1(self, key1: _K1) -> None:
         """Delete the entry associated with key1. Raises KeyError if key1 does not exist."""
         self.pop_by_key1(key1)
 
-    @enforce_argument_types
     def delete_by_key2(self, key2: _K2) -> None:
         """Delete the entry associated with key2. Raises KeyError if key2 does not exist."""
         self.pop_by_key2(key2)
     
     
     # Value Pop methods
-    @enforce_argument_types
     def pop_by_key1(self, key1: _K1) -> _V:
         """Remove and return the value associated with key1. Raises KeyError if key1 does not exist."""
-        try:
-            key2 = self._k1_to_k2.pop(key1)
-        except KeyError: pass
-        else:
-            self._k2_to_k1.pop(key2)
-            return self._values.pop(key1)
-        raise KeyError(f"key1 {key1!r} does not exist")
+        record = self._fwd.pop(key1, None)
+        if record is None:
+            raise KeyError(f"key1 {key1!r} does not exist")
+        del self._rev[record[0]]
+        return record[1]
 
-    @enforce_argument_types
     def pop_by_key2(self, key2: _K2) -> _V:
         """Remove and return the value associated with key2. Raises KeyError if key2 does not exist."""
-        try:
-            key1 = self._k2_to_k1.pop(key2)
-        except KeyError: pass
-        else:
-            self._k1_to_k2.pop(key1)
-            return self._values.pop(key1)
-        raise KeyError(f"key2 {key2!r} does not exist")
+        key1 = self._rev.pop(key2, _MISSING)
+        if key1 is _MISSING:
+            raise KeyError(f"key2 {key2!r} does not exist")
+        return self._fwd.pop(key1)[1]
 
-    @enforce_argument_types
     def pop_by_key1_with_default[_ARG](self, key1: _K1, default: _ARG) -> _V | _ARG:
         """Remove and return the value associated with key1, or return default if key1 does not exist."""
-        try:
-            return self.pop_by_key1(key1)
-        except KeyError:
+        record = self._fwd.pop(key1, None)
+        if record is None:
             return default
+        del self._rev[record[0]]
+        return record[1]
 
-    @enforce_argument_types
     def pop_by_key2_with_default[_ARG](self, key2: _K2, default: _ARG) -> _V | _ARG:
         """Remove and return the value associated with key2, or return default if key2 does not exist."""
-        try:
-            return self.pop_by_key2(key2)
-        except KeyError:
-            return default
+        key1 = self._rev.pop(key2, _MISSING)
+        return default if key1 is _MISSING else self._fwd.pop(key1)[1]
 
     
     # Key Update methods
-    @enforce_argument_types
     def change_key1_by_key2(self, key2: _K2, new_key1: _K1) -> None:
         """Change key1 while keeping key2 the same. Raises KeyError or ValueError on conflicts."""
         if not self.has_key2(key2):
@@ -205,7 +303,6 @@ class DualKeyDict(Generic[_K1, _K2, _V]):
         value = self.pop_by_key2(key2)
         self.set(new_key1, key2, value)
     
-    @enforce_argument_types
     def change_key2_by_key1(self, key1: _K1, new_key2: _K2) -> None:
         """Change key2 while keeping key1 the same. Raises KeyError or ValueError on conflicts."""
         if not self.has_key1(key1):
@@ -217,158 +314,163 @@ class DualKeyDict(Generic[_K1, _K2, _V]):
         self.set(key1, new_key2, value)        
 
 
-    @enforce_argument_types
     def change_key1_key2_by_key1(self, old_key1: _K1, new_key1: _K1, new_key2: _K2) -> None:
         """Change both keys using old_key1 to identify the entry. Raises KeyError or ValueError on conflicts."""
-        if not self.has_key1(old_key1):
+        record = self._fwd.get(old_key1) # records are tuples, so None means missing
+        if record is None:
             raise KeyError(f"old key1 {old_key1!r} does not exist")
-        if self.has_key1(new_key1):
-            real_key2 = self.get_key2_for_key1(new_key1)
-            raise ValueError(f"new key1 {new_key1!r} already exists with different key2 {real_key2!r}")
-        if self.has_key2(new_key2):
-            real_key1 = self.get_key1_for_key2(new_key2)
-            raise ValueError(f"new key2 {new_key2!r} already exists with different key1 {real_key1!r}")
-        value = self.pop_by_key1(old_key1)
-        self.set(new_key1, new_key2, value)        
+        self._rekey(old_key1, record, new_key1, new_key2)
 
-    @enforce_argument_types
     def change_key1_key2_by_key2(self, old_key2: _K2, new_key1: _K1, new_key2: _K2) -> None:
         """Change both keys using old_key2 to identify the entry. Raises KeyError or ValueError on conflicts."""
-        if not self.has_key2(old_key2):
+        old_key1 = self._rev.get(old_key2, _MISSING)
+        if old_key1 is _MISSING:
             raise KeyError(f"old key2 {old_key2!r} does not exist")
-        if self.has_key1(new_key1):
-            real_key2 = self.get_key2_for_key1(new_key1)
-            raise ValueError(f"new key1 {new_key1!r} already exists with different key2 {real_key2!r}")
-        if self.has_key2(new_key2):
-            real_key1 = self.get_key1_for_key2(new_key2)
+        self._rekey(old_key1, self._fwd[old_key1], new_key1, new_key2)
+    
+    def _rekey(self, old_key1: _K1, record: tuple[_K2, _V], new_key1: _K1, new_key2: _K2) -> None:
+        """Move an existing entry to two new keys, which must both be unused. Raises ValueError otherwise."""
+        conflict = self._fwd.get(new_key1)
+        if conflict is not None:
+            raise ValueError(f"new key1 {new_key1!r} already exists with different key2 {conflict[0]!r}")
+        real_key1 = self._rev.get(new_key2, _MISSING)
+        if real_key1 is not _MISSING:
             raise ValueError(f"new key2 {new_key2!r} already exists with different key1 {real_key1!r}")
-        value = self.pop_by_key2(old_key2)
-        self.set(new_key1, new_key2, value)
+        del self._fwd[old_key1]
+        del self._rev[record[0]]
+        self._fwd[new_key1] = (new_key2, record[1])
+        self._rev[new_key2] = new_key1
     
 
     # Key Access methods
-    @enforce_argument_types
     def has_key1(self, key1: _K1) -> bool:
         """Check if key1 exists in the dictionary."""
-        return key1 in self._values
+        return key1 in self._fwd
     
-    @enforce_argument_types
     def has_key2(self, key2: _K2) -> bool:
         """Check if key2 exists in the dictionary."""
-        return key2 in self._k2_to_k1
+        return key2 in self._rev
 
-    @enforce_argument_types
     def get_key1_for_key2(self, key2: _K2) -> _K1:
         """Get key1 paired with the given key2. Raises KeyError if key2 does not exist."""
-        try:
-            return self._k2_to_k1[key2]
-        except KeyError: pass
-        raise KeyError(f"key2 {key2!r} does not exist")
+        key1 = self._rev.get(key2, _MISSING)
+        if key1 is _MISSING:
+            raise KeyError(f"key2 {key2!r} does not exist")
+        return key1
 
-    @enforce_argument_types
     def get_key2_for_key1(self, key1: _K1) -> _K2:
         """Get key2 paired with the given key1. Raises KeyError if key1 does not exist."""
-        try:
-            return self._k1_to_k2[key1]
-        except KeyError: pass
-        raise KeyError(f"key1 {key1!r} does not exist")
+        record = self._fwd.get(key1)
+        if record is None:
+            raise KeyError(f"key1 {key1!r} does not exist")
+        return record[0]
 
 
     # Iteration methods
     def keys_key1(self) -> Iterable[_K1]:
         """Return an iterable of all key1 values."""
-        return self._values.keys()
+        return self._fwd.keys()
 
     def keys_key2(self) -> Iterable[_K2]:
         """Return an iterable of all key2 values."""
-        return self._k2_to_k1.keys()
+        return self._rev.keys()
 
     def keys_key1_key2(self) -> Iterable[tuple[_K1, _K2]]:
         """Return an iterable of (key1, key2) tuples."""
-        return self._k1_to_k2.items()
+        return _KeyPairsView(self._fwd)
 
     def keys_key2_key1(self) -> Iterable[tuple[_K2, _K1]]:
         """Return an iterable of (key2, key1) tuples."""
-        return self._k2_to_k1.items()
+        return self._rev.items()
 
 
     def values(self) -> Iterable[_V]:
         """Return an iterable of all values."""
-        return self._values.values()
+        return _ValuesView(self._fwd)
     
     
     def items_key1(self) -> Iterable[tuple[_K1, _V]]:
         """Return an iterable of (key1, value) tuples."""
-        return self._values.items()
+        return _Key1ItemsView(self._fwd)
 
     def items_key2(self) -> Iterator[tuple[_K2, _V]]:
         """Return an iterator of (key2, value) tuples."""
-        for key2 in self._k2_to_k1.keys():
-            yield (key2, self.get_by_key2(key2))
+        # _fwd and _rev always gain and lose entries together, so they share the same order.
+        # The immutable (key2, value) records can be handed out as they are
+        yield from self._fwd.values()
 
     def items_key1_key2(self) -> Iterator[tuple[_K1, _K2, _V]]:
         """Return an iterator of (key1, key2, value) tuples."""
-        for key1, key2 in self._k1_to_k2.items():
-            yield (key1, key2, self.get_by_key1(key1))
+        for key1, (key2, value) in self._fwd.items():
+            yield (key1, key2, value)
 
     def items_key2_key1(self) -> Iterator[tuple[_K2, _K1, _V]]:
         """Return an iterator of (key2, key1, value) tuples."""
-        for key2, key1 in self._k2_to_k1.items():
-            yield (key2, key1, self.get_by_key1(key1))
+        for key1, (key2, value) in self._fwd.items():
+            yield (key2, key1, value)
     
 
     # Allowed dunder methods
     def __len__(self) -> int:
         """Return the number of entries in the dictionary."""
-        return len(self._values)
+        return len(self._fwd)
 
     def __eq__(self, other: object, /) -> bool:
         """Check equality with another DualKeyDict."""
         if not isinstance(other, DualKeyDict):
             return NotImplemented
-        return (self._values == other._values) and (self._k2_to_k1 == other._k2_to_k1) and (self._k1_to_k2 == other._k1_to_k2)
+        # _rev is fully determined by _fwd
+        return self._fwd == other._fwd
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the DualKeyDict."""
-        from gceutils.repr import grepr
+        grepr = _DEFERRED_IMPORTS.get("grepr") or _load_deferred_imports()["grepr"]
         return grepr(self)
     
     def __bool__(self) -> bool:
         """Return True if the dictionary is non-empty, False otherwise."""
         return bool(len(self))
 
-    @enforce_argument_types
     def __or__[_ARG_K1, _ARG_K2, _ARG_V](self, value: DualKeyDict[_ARG_K1, _ARG_K2, _ARG_V], /) -> DualKeyDict[_K1|_ARG_K1, _K2|_ARG_K2, _V|_ARG_V]:
         """Return a new DualKeyDict with merged contents using the | operator."""
+        if not isinstance(value, DualKeyDict):
+            return NotImplemented
         copy = self.copy()
         return copy.__ior__(value)
 
-    @enforce_argument_types
     def __ror__[_ARG_K1, _ARG_K2, _ARG_V](self, value: DualKeyDict[_ARG_K1, _ARG_K2, _ARG_V], /) -> DualKeyDict[_K1|_ARG_K1, _K2|_ARG_K2, _V|_ARG_V]:
         """Return a new DualKeyDict with merged contents using the | operator (right operand)."""
+        if not isinstance(value, DualKeyDict):
+            return NotImplemented
         copy = self.copy()
         return copy.__ior__(value)
 
-    @enforce_argument_types
     def __ior__[_ARG_K1, _ARG_K2, _ARG_V](self, value: DualKeyDict[_ARG_K1, _ARG_K2, _ARG_V], /) -> DualKeyDict[_K1|_ARG_K1, _K2|_ARG_K2, _V|_ARG_V]:
         """Merge another DualKeyDict into this one using the |= operator. Raises ValueError on key conflicts."""
-        for key1, key2, evalue in value.items_key1_key2():
-            has_key1 = self.has_key1(key1)
-            has_key2 = self.has_key2(key2)
-            
-            if  has_key1 and not(has_key2):
-                real_key2 = self.get_key2_for_key1(key1)
-                raise ValueError(f"key1 {key1!r} already exists in DualKeyDict with different key2 {real_key2!r}")
-            elif has_key2 and not(has_key1):
-                real_key1 = self.get_key1_for_key2(key2)
-                raise ValueError(f"key2 {key2!r} already exists in DualKeyDict with different key1 {real_key1!r}")
-            elif self.get_key2_for_key1(key1) != key2:
-                real_key2 = self.get_key2_for_key1(key1)
-                raise ValueError(f"key1 {key1!r} exists in DualKeyDict with different key2 {real_key2!r}")
-            
-            self._values  [key1] = evalue
-            self._k2_to_k1[key2] = key1
-            self._k1_to_k2[key1] = key2
+        if not isinstance(value, DualKeyDict):
+            return NotImplemented
+        fwd, rev = self._fwd, self._rev
+        other_fwd, other_rev = value._fwd, value._rev
+        # keys both sides share must pair up identically, everything else can be copied in bulk
+        if (any(fwd[key1][0] != other_fwd[key1][0] for key1 in fwd.keys() & other_fwd.keys())
+            or any(rev[key2] != other_rev[key2] for key2 in rev.keys() & other_rev.keys())):
+            self._raise_merge_conflict(value)
+        fwd.update(other_fwd)
+        rev.update(other_rev)
+        return self
+
+    def _raise_merge_conflict(self, value: DualKeyDict, /) -> None:
+        """Raise ValueError for the first entry of value which conflicts with this DualKeyDict."""
+        for key1, (key2, _) in value._fwd.items():
+            record = self._fwd.get(key1)
+            real_key1 = self._rev.get(key2, _MISSING)
+            if record is None:
+                if real_key1 is not _MISSING:
+                    raise ValueError(f"key2 {key2!r} already exists in DualKeyDict with different key1 {real_key1!r}")
+            elif real_key1 is _MISSING:
+                raise ValueError(f"key1 {key1!r} already exists in DualKeyDict with different key2 {record[0]!r}")
+            elif record[0] != key2:
+                raise ValueError(f"key1 {key1!r} exists in DualKeyDict with different key2 {record[0]!r}")
     
     
     # Forbidden dunder methods
@@ -1,8 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 import os
 import shutil
+import struct
 import zipfile, zlib
 
 from gceutils.decorators import enforce_argument_types
@@ -10,6 +12,29 @@ from gceutils.errors     import (
     GU_FileNotFoundError, GU_FailedFileWriteError, GU_FailedFileReadError, GU_FailedFileDeleteError,
 )
 
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_LOCAL_HEADER_SIZE = 30
+_ENCRYPTED_FLAG = 0x1
+
+def _read_zip_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, archive: bytes) -> bytes:
+    """
+    Decompress a stored or deflated member straight from the archive bytes, skipping the per entry file objects.
+    Anything else (encryption, other compression methods, odd headers) is left to zipfile
+    """
+    offset = info.header_offset
+    if ((info.flag_bits & _ENCRYPTED_FLAG) or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        or archive[offset:offset + 4] != _LOCAL_HEADER_SIGNATURE):
+        with zip_ref.open(info) as file_ref:
+            return file_ref.read()
+    name_length, extra_length = struct.unpack_from("<HH", archive, offset + 26)
+    start = offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+    data = archive[start:start + info.compress_size]
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        data = zlib.decompress(data, -zlib.MAX_WBITS, max(info.file_size, 1))
+    if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad size or CRC-32 for file {info.filename!r}")
+    return data
+
 @enforce_argument_types
 def read_all_files_of_zip(zip_source: str | Path | BytesIO) -> dict[str, bytes]:
     """
@@ -32,14 +57,21 @@ def read_all_files_of_zip(zip_source: str | Path | BytesIO) -> dict[str, bytes]:
     """
     contents = {}
     try:
-        with zipfile.ZipFile(str(zip_source) if isinstance(zip_source, Path) else zip_source, "r") as zip_ref:
-            for file_name in zip_ref.namelist():
+        # Every member is read anyway, so load the whole archive once and decompress from it
+        if isinstance(zip_source, BytesIO):
+            archive = zip_source.getvalue()
+        else:
+            with open(zip_source, "rb") as file:
+                archive = file.read()
+        with zipfile.ZipFile(BytesIO(archive), "r") as zip_ref:
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
                 try:
-                    with zip_ref.open(file_name) as file_ref:
-                        contents[file_name] = file_ref.read()
-                except (zlib.error, EOFError, MemoryError, OverflowError, KeyError,) as error:
+                    contents[info.filename] = _read_zip_member(zip_ref, info, archive)
+                except (zlib.error, EOFError, MemoryError, OverflowError, KeyError, struct.error,) as error:
                     raise GU_FailedFileReadError(
-                        f"Failed to extract {file_name!r} from zip {zip_source!r}: {error}"
+                        f"Failed to extract {info.filename!r} from zip {zip_source!r}: {error}"
                     ) from error
 
     except FileNotFoundError as error:
@@ -69,8 +101,9 @@ def read_file_text(file_path: str | Path, encoding: str = "utf-8") -> str:
         GU_FileNotFoundError: If the file was not found
         GU_FailedFileReadError: For OS-related errors like, closed, permission denied, invalid path, or decoding failures
     """
+    path = os.fspath(file_path)
     try:
-        with open(str(file_path) if isinstance(file_path, Path) else file_path, "r", encoding=encoding) as file:
+        with open(path, "r", encoding=encoding) as file:
             return file.read()
 
     except FileNotFoundError as error:
@@ -96,8 +129,9 @@ def write_file_text(file_path: str | Path, text: str, encoding: str = "utf-8") -
                                  is a directory, or other I/O-related failure) or `text` is not compatible with `encoding`
     """
 
+    path = os.fspath(file_path)
     try:
-        with open(str(file_path) if isinstance(file_path, Path) else file_path, mode="w", encoding=encoding) as file:
+        with open(path, mode="w", encoding=encoding) as file:
             file.write(text)
 
     except ValueError as error:
@@ -121,8 +155,9 @@ def delete_file(file_path: str | Path) -> None:
                                   is a directory, or other I/O-related failure)
     """
 
+    path = os.fspath(file_path)
     try:
-        os.remove(str(file_path) if isinstance(file_path, Path) else file_path)
+        os.remove(path)
 
     except ValueError as error:
         raise ValueError(str(error)) from error
@@ -142,14 +177,32 @@ def delete_directory(dir_path: str | Path) -> None:
         GU_FailedFileDeleteError: If an OS-level error occurs (e.g., directory not found, permission denied,
                                       is a file, or other I/O-related failure)
     """
+    path = os.fspath(dir_path)
     try:
-        shutil.rmtree(str(dir_path) if isinstance(dir_path, Path) else dir_path)
+        shutil.rmtree(path)
     
     except ValueError as error:
         raise ValueError(str(error)) from error
     except (FileNotFoundError, PermissionError, NotADirectoryError, OSError) as error:
         raise GU_FailedFileDeleteError(f"Failed to delete directory at {dir_path!r}: {error}") from error
 
+# File signatures of formats whose data is already compressed, deflating them again only costs time
+_COMPRESSED_MAGIC_PREFIXES = (
+    b"\x89PNG",            # PNG
+    b"\xff\xd8\xff",       # JPEG
+    b"GIF8",               # GIF
+    b"PK\x03\x04",         # ZIP and ZIP based formats
+    b"\x1f\x8b",           # gzip
+    b"BZh",                # bzip2
+    b"\xfd7zXZ\x00",       # xz
+    b"\x28\xb5\x2f\xfd",   # zstd
+    b"7z\xbc\xaf\x27\x1c", # 7z
+    b"ID3",                # MP3 with ID3 tag
+    b"OggS",               # Ogg
+    b"fLaC",               # FLAC
+    b"wOF2",               # WOFF2
+)
+
 @enforce_argument_types
 def create_zip_file(zip_path: str | Path, contents: dict[str, bytes]) -> None:
     """
@@ -159,10 +212,17 @@ def create_zip_file(zip_path: str | Path, contents: dict[str, bytes]) -> None:
         zip_path: Destination path (str or pathlib.Path) for the ZIP file
         contents: A dictionary where keys are filenames (inside the ZIP)
                   and values are their corresponding file contents in bytes
+
+    Notes:
+        - Entries are written sorted by name, so equal contents give the same archive layout
+        - Data that is already compressed (e.g. PNG, JPEG, ZIP, gzip) is stored instead of deflated again
     """ # TODO: add good error handling
-    with zipfile.ZipFile(str(zip_path) if isinstance(zip_path, Path) else zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_out:
-        for name, data in contents.items():
-            zip_out.writestr(name, data)
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_out:
+        for name, data in sorted(contents.items()):
+            if data.startswith(_COMPRESSED_MAGIC_PREFIXES):
+                zip_out.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+            else:
+                zip_out.writestr(name, data)
 
 @enforce_argument_types
 def file_exists(file_path: str | Path) -> bool:
@@ -172,8 +232,9 @@ def file_exists(file_path: str | Path) -> bool:
     Args:
         file_path: the path (str or pathlib.Path) to check
     """
+    path = os.fspath(file_path)
     try:
-        return os.path.exists(str(file_path) if isinstance(file_path, Path) else file_path)
+        return os.path.exists(path)
     
     except TypeError as error:
         raise TypeError(str(error)) from error
@@ -182,9 +243,27 @@ def file_exists(file_path: str | Path) -> bool:
     except OSError as error:
         raise
 
+@lru_cache(maxsize=256)
+def _cached_path_exists(path: str) -> bool:
+    return os.path.exists(path)
+
+@enforce_argument_types
+def file_exists_cached(file_path: str | Path) -> bool:
+    """
+    Checks if a file exists at the specified path, remembering the results for the last 256 paths.
+    Only use it when the checked files are not created or deleted in the meantime;
+    call file_exists_cached.cache_clear() after changing the filesystem
+
+    Args:
+        file_path: the path (str or pathlib.Path) to check
+    """
+    return _cached_path_exists(os.fspath(file_path)) # str and Path share one cache entry
+
+file_exists_cached.cache_clear = _cached_path_exists.cache_clear
+
 
 __all__ = [
     "read_all_files_of_zip", "read_file_text", "write_file_text", 
-    "delete_file", "delete_directory", "create_zip_file", "file_exists",
+    "delete_file", "delete_directory", "create_zip_file", "file_exists", "file_exists_cached",
 ]
 
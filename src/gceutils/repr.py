@@ -2,7 +2,7 @@ from __future__  import annotations
 from dataclasses import fields
 from enum        import Enum
 from types       import NotImplementedType
-from typing      import Any, TYPE_CHECKING
+from typing      import Any, Iterable, TYPE_CHECKING
 
 from gceutils.dual_key_dict import DualKeyDict
 
@@ -10,6 +10,11 @@ if TYPE_CHECKING:
     from dataclasses import Field
     from gceutils.base import AbstractTreePath
 
+# exact types which grepr always shows with the builtin repr
+_LEAF_TYPES = frozenset({int, float, bool, complex, bytes, type(None)})
+_COLLECTION_TYPES = frozenset({list, tuple, set})
+_MISSING = object()
+
 
 class KeyReprDict(dict[Any, Any]):
     """Dict subclass that displays only its keys in repr, not values. Inherits all dict functionality."""
@@ -74,6 +79,8 @@ class GreprRepresentationImplementation(RepresentationImplementation):
         self.safe_dkd = safe_dkd
         self.annotate_fields = annotate_fields
         self.vanilla_strings = vanilla_strings
+        self._layouts: dict[int, tuple[int, str, str, str]] = {}
+        self._grepr_field_names: dict[type, tuple[str, ...]] = {}
 
     def is_compatible_dataclass_instance(self, obj: Any) -> bool:
         """Check whether object opts into grepr dataclass-style formatting."""
@@ -107,7 +114,29 @@ class GreprRepresentationImplementation(RepresentationImplementation):
 
         return get_field_options(field)
 
+    def get_grepr_field_names(self, obj: Any) -> tuple[str, ...]:
+        """
+        Names of the dataclass fields to include in the representation.
+        Uses the tuple precomputed by @grepr_dataclass unless get_field_options is overridden.
+        The result is remembered per class for the lifetime of this formatter.
+        """
+        cls = type(obj)
+        field_names = self._grepr_field_names.get(cls)
+        if field_names is None:
+            field_names = cls.__dict__.get("__grepr_fields__")
+            if (field_names is None) or (type(self).get_field_options is not GreprRepresentationImplementation.get_field_options):
+                field_names = tuple(field.name for field in fields(obj) if self.get_field_options(field)["grepr"])
+            self._grepr_field_names[cls] = field_names
+        return field_names
+
     def layout(self, level: int) -> tuple[int, str, str, str]:
+        """Next level, prefix, separator and end separator for children at level; built once per level."""
+        layout = self._layouts.get(level)
+        if layout is None:
+            layout = self._layouts[level] = self.build_layout(level)
+        return layout
+
+    def build_layout(self, level: int) -> tuple[int, str, str, str]:
         if self.indent is not None:
             level += 1
             prefix = "\n" + self.indent * level
@@ -128,11 +157,22 @@ class GreprRepresentationImplementation(RepresentationImplementation):
                 return special_case
             return special_case, True
 
+        # common leaves skip the isinstance chain below and never need a layout
+        obj_type = type(obj)
+        if obj_type in _LEAF_TYPES:
+            return repr(obj), True
+        if obj_type is str:
+            return self.format_string(obj)
+
         next_level, prefix, sep, end_sep = self.layout(level)
 
-        if isinstance(obj, (list, tuple, set)):
+        # exact types are checked first as they are by far the most common, isinstance catches subclasses
+        if obj_type in _COLLECTION_TYPES or isinstance(obj, (list, tuple, set)):
             return self.format_collection(obj, next_level, prefix, sep, end_sep, path)
 
+        if obj_type is dict:
+            return self.format_dict(obj, next_level, prefix, sep, end_sep, path)
+
         if isinstance(obj, DualKeyDict):
             return self.format_dual_key_dict(obj, next_level, prefix, sep, end_sep, path)
 
@@ -162,17 +202,34 @@ class GreprRepresentationImplementation(RepresentationImplementation):
         opening, closing = (
             ("[", "]") if isinstance(obj, list) else ("(", ")") if isinstance(obj, tuple) else ("{", "}")
         )
+        return self.format_items(obj, opening, closing, level, prefix, sep, end_sep, path)
 
+    def format_items(
+        self,
+        obj: Iterable[Any],
+        opening: str,
+        closing: str,
+        level: int,
+        prefix: str,
+        sep: str,
+        end_sep: str,
+        path: AbstractTreePath | None = None,
+    ) -> tuple[str, bool]:
+        """Format the items of a sized iterable between the given brackets."""
         if not obj:
             return f"{opening}{closing}", True
 
+        # one pass: every item is rendered once and the compact/multiline choice is made on the same strings
         strings: list[str] = []
+        append = strings.append
+        format_value = self.format_value
+        extend_path = self.extend_path_with_index_or_key
         allsimple = True
         for index, item in enumerate(obj):
-            item_path = self.extend_path_with_index_or_key(path, index)
-            item_s, simple = self.format_value(item, level, item_path)
-            allsimple = allsimple and simple and (len(item_s) <= 40)
-            strings.append(item_s)
+            item_s, simple = format_value(item, level, extend_path(path, index))
+            if allsimple and not (simple and len(item_s) <= 40):
+                allsimple = False
+            append(item_s)
 
         if allsimple:
             return f"{opening}{', '.join(strings)}{closing}", True
@@ -190,20 +247,18 @@ class GreprRepresentationImplementation(RepresentationImplementation):
         if not obj:
             return ("DualKeyDict()" if self.safe_dkd else "DualKeyDict{}"), True
 
-        args: list[tuple[str, str, str]] = []
-        for key1, key2, value in obj.items_key1_key2():
-            branch_path = self.extend_path_with_index_or_key(path, (key1, key2))
-            key1_str, _ = self.format_value(key1, level, branch_path)
-            key2_str, _ = self.format_value(key2, level, branch_path)
-            value_str, _ = self.format_value(value, level, branch_path)
-            args.append((key1_str, key2_str, value_str))
-
         if self.safe_dkd:
-            strings = [f"({key1_str}, {key2_str}): {value_str}" for key1_str, key2_str, value_str in args]
-            fmt = "DualKeyDict({%s})"
+            entry_fmt, fmt = "(%s, %s): %s", "DualKeyDict({%s})"
         else:
-            strings = [f"{key1_str} / {key2_str}: {value_str}" for key1_str, key2_str, value_str in args]
-            fmt = "DualKeyDict{%s}"
+            entry_fmt, fmt = "%s / %s: %s", "DualKeyDict{%s}"
+        strings: list[str] = []
+        for key1, key2, value in obj.items_key1_key2():
+            branch_path = self.extend_path_with_index_or_key(path, (key1, key2))
+            strings.append(entry_fmt % (
+                self.format_value(key1, level, branch_path)[0],
+                self.format_value(key2, level, branch_path)[0],
+                self.format_value(value, level, branch_path)[0],
+            ))
         return fmt % f"{prefix}{sep.join(strings)}{end_sep}", False
 
     def format_key_repr_dict(
@@ -212,8 +267,9 @@ class GreprRepresentationImplementation(RepresentationImplementation):
         level: int,
         path: AbstractTreePath | None = None,
     ) -> tuple[str, bool]:
-        keys_str, is_simple = self.format_value(tuple(obj.keys()), level - 1, path)
-        keys_str = "{" + keys_str.removeprefix("(").removesuffix(")") + "}"
+        # the keys are laid out like a collection at the dict's own level
+        _, prefix, sep, end_sep = self.layout(level - 1)
+        keys_str, is_simple = self.format_items(obj.keys(), "{", "}", level, prefix, sep, end_sep, path)
         return f"KeyReprDict(keys={keys_str})", is_simple
 
     def format_dict(
@@ -257,18 +313,15 @@ class GreprRepresentationImplementation(RepresentationImplementation):
     ) -> tuple[str, bool]:
         args: list[str] = []
         allsimple = True
-        for field in fields(obj):
-            options = self.get_field_options(field)
-            if not options["grepr"]:
-                continue
-            if not hasattr(obj, field.name):
+        for name in self.get_grepr_field_names(obj):
+            value = getattr(obj, name, _MISSING)
+            if value is _MISSING:
                 continue
-            value = getattr(obj, field.name)
-            field_path = self.extend_path_with_attribute(path, field.name)
+            field_path = self.extend_path_with_attribute(path, name)
             value_str, simple = self.format_value(value, level, field_path)
             allsimple = allsimple and simple
             if self.annotate_fields:
-                args.append(f"{field.name}={value_str}")
+                args.append(f"{name}={value_str}")
             else:
                 args.append(value_str)
 
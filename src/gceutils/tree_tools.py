@@ -1,6 +1,7 @@
 from __future__  import annotations
 from dataclasses import fields as get_fields
-from typing      import cast, Generic, TypeVar, Iterable, Any
+from functools   import lru_cache
+from typing      import cast, Generic, TypeVar, Iterable, Iterator, Any
 
 from gceutils.base       import grepr_dataclass, AbstractTreePath
 from gceutils.decorators import enforce_argument_types
@@ -9,6 +10,17 @@ from gceutils.decorators import enforce_argument_types
 INCLUDED_T = TypeVar("INCLUDED_T")
 DEFAULT_T = TypeVar("DEFAULT_T")
 
+_SEQ_TYPES = frozenset({list, tuple, set, frozenset})
+
+@lru_cache(maxsize=256)
+def _yield_fields(cls: type[Any]) -> tuple[str, ...]:
+    """Cached field names of a dataclass node type; empty for other types. Fields of a class never change."""
+    try:
+        fields = get_fields(cls)
+    except TypeError:
+        return ()
+    return tuple(field.name for field in fields)
+
 @grepr_dataclass(frozen=True, unsafe_hash=True)
 class TreeVisitor(Generic[INCLUDED_T]):
     """
@@ -37,55 +49,70 @@ class TreeVisitor(Generic[INCLUDED_T]):
         return cls(tuple(included))
     
     @staticmethod
-    def _get_yield_fields(cls: type[Any]) -> list[str]:
+    def _get_yield_fields(cls: type[Any]) -> tuple[str, ...]:
         """
         Get the relevant fields of a dataclass-like node type.
         **NOTE: Only works with dataclasses.**
         """
-        try:
-            fields = get_fields(cls)
-        except TypeError:
-            return []
-        return [field.name for field in fields]
+        return _yield_fields(cls)
     
     @classmethod
     def _visit_node_unfiltered(cls,
         obj: Any | list[Any] | tuple[Any] | dict[Any, Any], 
         path: AbstractTreePath,
-    ) -> Iterable[tuple[AbstractTreePath, Any]]:
+    ) -> Iterator[tuple[AbstractTreePath, Any]]:
         """
         Run the tree visitor unfiltered on an arbitrary object tree.
-        Returns pairs of node path (from tree root to value) and node value.
+        Lazily yields pairs of node path (from tree root to value) and node value, depth first.
         **NOTE: Non-dataclass objects (except list, tuple, set, frozenset, dict) will only be yielded as values,
         their attributes will not be traversed.**
         
         Args:
-            obj: the object tree to iterate recursively
+            obj: the object tree to iterate
             path: the path from the tree root to obj
         """
-        pairs = []
-        if   isinstance(obj, (list, tuple, set, frozenset)):
-            for i, item in enumerate(obj):
-                current_path = path.add_index_or_key(i)
-                pairs.append((current_path, item))
-                pairs.extend(cls._visit_node_unfiltered(item, current_path))
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                current_path = path.add_index_or_key(key)
-                pairs.append((current_path, value))
-                pairs.extend(cls._visit_node_unfiltered(value, current_path))
-        elif callable(getattr(obj, "_visit_node_unfiltered_", None)):
+        # an explicit stack of child iterators instead of one Python frame per tree level
+        children, descend = cls._expand_node(obj, path)
+        if not descend:
+            yield from children
+            return
+        stack = [iter(children)]
+        while stack:
+            for current_path, value in stack[-1]:
+                yield (current_path, value)
+                children, descend = cls._expand_node(value, current_path)
+                if descend:
+                    stack.append(iter(children))
+                    break
+                yield from children
+            else:
+                stack.pop()
+
+    @classmethod
+    def _expand_node(cls, obj: Any, path: AbstractTreePath) -> tuple[Iterable[tuple[AbstractTreePath, Any]], bool]:
+        """
+        Get the pairs of child path and child value below a node, and whether they still have to be visited.
+        Results of custom _visit_node_unfiltered_ methods already cover the whole subtree.
+        """
+        # exact types first, isinstance only decides for subclasses
+        obj_type = type(obj)
+        if   obj_type in _SEQ_TYPES or isinstance(obj, (list, tuple, set, frozenset)):
+            return ((path.add_index_or_key(i), item) for i, item in enumerate(obj)), True
+        elif obj_type is dict or isinstance(obj, dict):
+            return ((path.add_index_or_key(key), value) for key, value in obj.items()), True
+        custom_visit = getattr(obj, "_visit_node_unfiltered_", None)
+        if callable(custom_visit):
             # allow defining custom _visit_node_unfiltered_ methods on classes
-            pairs.extend(obj._visit_node_unfiltered_(path))
-        else:
-            fields = cls._get_yield_fields(type(obj))
-            for field in fields:
-                value = getattr(obj, field)
-                if value is not None:
-                    current_path = path.add_attribute(field)
-                    pairs.append((current_path, value))
-                    pairs.extend(cls._visit_node_unfiltered(value, current_path))
-        return pairs
+            return custom_visit(path), False
+        return cls._iter_field_children(obj, path), True
+
+    @classmethod
+    def _iter_field_children(cls, obj: Any, path: AbstractTreePath) -> Iterator[tuple[AbstractTreePath, Any]]:
+        """Yield the non-None dataclass fields of a node as pairs of child path and child value."""
+        for field in cls._get_yield_fields(type(obj)):
+            value = getattr(obj, field)
+            if value is not None:
+                yield (path.add_attribute(field), value)
 
     # INCLUDED_T will be inferred as Any by type checkers, no solution possible currently
     @enforce_argument_types
@@ -96,12 +123,12 @@ class TreeVisitor(Generic[INCLUDED_T]):
         **NOTE: Non-dataclass objects (except list, tuple, set, frozenset, dict) will only be yielded as values,
         their attributes will not be traversed.**
         """
-        unfiltered_pairs = self._visit_node_unfiltered(obj, path=AbstractTreePath())
-        filtered_map: dict[AbstractTreePath, INCLUDED_T] = {}
-        for path, value in unfiltered_pairs:
-            if isinstance(value, self.included_types):
-                filtered_map[path] = cast(INCLUDED_T, value)
-        return filtered_map
+        included_types = self.included_types
+        return {
+            path: cast(INCLUDED_T, value)
+            for path, value in self._visit_node_unfiltered(obj, path=AbstractTreePath())
+            if isinstance(value, included_types)
+        }
 
 
 __all__ = ["TreeVisitor"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 import inspect
 import os
 import re
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Callable
 from urllib.parse import urlparse
@@ -12,9 +12,17 @@ from gceutils.decorators import enforce_type, _repr_type, AbstractTreePath
 from gceutils.errors import GU_PathValidationError, GU_TypeValidationError, GU_RangeValidationError, GU_InvalidValueError
 
 
+_HEX_COLOR_RE = re.compile(r'#([0-9a-fA-F]{6})')
+_JS_DATA_URI_RE = re.compile(r"^data:application/javascript(;charset=[^,]+)?,.*")
+
 def _value_and_descr(obj, attr: str) -> tuple[Any, str]:
     return getattr(obj, attr), f"{attr} of a {_repr_type(obj.__class__)}"
 
+@lru_cache(maxsize=256)
+def _parameter_count(fn: Callable[..., Any]) -> int:
+    """Cached parameter count of fn; inspect.signature is slow and validators often share their functions."""
+    return len(inspect.signature(fn).parameters)
+
 def _passes(fn: Callable[..., Any], *args, **kwargs) -> bool:
     try:
         fn(*args, **kwargs)
@@ -41,7 +49,7 @@ class Validator(Callable[..., None]):
 
     @cached_property
     def is_valid_arg_count(self) -> int:
-        return len(inspect.signature(self.is_valid_fn).parameters) + 2 # - attr_value + self, path, attr
+        return _parameter_count(self.is_valid_fn) + 2 # - attr_value + self, path, attr
 
     def __call__(self, obj: Any, path: AbstractTreePath, attr: str, *args, condition: str | None = None) -> None:
         if self.pre_validate_fn is not None:
@@ -126,7 +134,7 @@ class ValidateAttribute:
 
     # MATCH-FORMAT
     VA_HEX_COLOR = Validator(
-        is_valid_fn=lambda attr_value: isinstance(attr_value, str) and bool(re.fullmatch(r'#([0-9a-fA-F]{6})', attr_value)),
+        is_valid_fn=lambda attr_value: isinstance(attr_value, str) and (_HEX_COLOR_RE.fullmatch(attr_value) is not None),
         error_cls=GU_InvalidValueError,
         create_error_fn=lambda attr_value, descr: f"{descr} must be a valid hex color eg. '#FF0956'"
     )
@@ -139,8 +147,7 @@ class ValidateAttribute:
 
 def is_valid_js_data_uri(s) -> bool:
     """Check if string is a valid JavaScript data URI."""
-    pattern = r"^data:application/javascript(;charset=[^,]+)?,.*"
-    return re.match(pattern, s) is not None
+    return _JS_DATA_URI_RE.match(s) is not None
 
 def is_valid_directory_path(path_str: str) -> bool:
     """Check if path exists as a directory or can be created in a writable parent directory."""
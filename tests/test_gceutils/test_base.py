@@ -62,6 +62,20 @@ class TestAbstractTreePath:
         path_str = str(path)
         assert "." in path_str or path_str == "."
 
+    def test_path_objects_are_slotted(self):
+        """Test that paths and their items carry no per-instance __dict__."""
+        path = AbstractTreePath().add_attribute("a").add_index_or_key(0)
+        assert not hasattr(path, "__dict__")
+        assert not any(hasattr(item, "__dict__") for item in path)
+        with pytest.raises(AttributeError):
+            path.path = ()
+
+    def test_add_attribute_reuses_items(self):
+        """Test that attribute items are interned across paths."""
+        first = AbstractTreePath().add_attribute("shared")
+        second = AbstractTreePath().add_index_or_key(0).add_attribute("shared")
+        assert first[0] is second[1]
+
 
 class TestGreprDataclass:
     """Test grepr_dataclass decorator."""
@@ -135,7 +149,34 @@ class TestGreprDataclass:
         
         # Validate should not raise for correct types
         obj.validate()
-    
+
+    def test_grepr_dataclass_validate_plan(self):
+        """Test that the validation plan is built per class, lazily when annotations can not be resolved yet."""
+        @grepr_dataclass()
+        class Early:
+            later: LaterDefined
+
+        assert "__validate_plan__" not in Early.__dict__
+
+        @grepr_dataclass()
+        class Base:
+            count: int
+
+        @grepr_dataclass()
+        class Child(Base):
+            extra: str = field(validate_type=False, call_subvalidate=True)
+
+        type_checks, subvalidate_checks = Child.__validate_plan__
+        assert [(name, plain_type) for name, _, _, plain_type in type_checks] == [("count", int)]
+        assert subvalidate_checks == ("extra",)
+
+    def test_grepr_dataclass_invalid_annotation_raises_at_decoration(self):
+        """Only unresolved names are deferred; a broken annotation fails when the class is decorated."""
+        with pytest.raises(SyntaxError):
+            @grepr_dataclass()
+            class Broken:
+                value: "not valid python"
+
     def test_grepr_dataclass_forbid_init_only_subcls(self):
         """Test forbid_init_only_subcls feature."""
         @grepr_dataclass(forbid_init_only_subcls=True, init=False)
@@ -287,7 +328,34 @@ class TestField:
         """Test field with grepr option."""
         f = field(grepr=False)
         assert f is not None
-    
+
+    def test_field_options_stored_on_field(self):
+        """Test that field options live on the returned field and plain fields fall back to defaults."""
+        from dataclasses import field as base_field
+        from gceutils.base import GreprField, get_field_options
+        f = field(grepr=False, call_subvalidate=True)
+        assert isinstance(f, GreprField)
+        assert f.grepr is False
+        assert f.call_subvalidate is True
+        assert get_field_options(base_field())["validate_type"] is True
+
+    def test_update_field_plain_field_in_place(self):
+        """update_field stores options for a plain dataclass Field without replacing it."""
+        from dataclasses import field as base_field
+        from gceutils.base import update_field, get_field_options
+        hidden = base_field(default=2)
+        assert update_field(hidden, grepr=False, validate_type=False) is None
+        update_field(hidden, grepr=True) # the first options stored win
+        assert get_field_options(hidden)["grepr"] is False
+
+        @grepr_dataclass()
+        class Plain:
+            a: int = 1
+            b: int = hidden
+
+        assert repr(Plain()) == "Plain(a=1)"
+        Plain(b="not an int").validate() # validate_type=False skips b
+
     def test_field_in_dataclass(self):
         """Test using field in a dataclass."""
         @grepr_dataclass()
@@ -314,6 +382,14 @@ class TestNotSetType:
         assert not NotSet
         assert bool(NotSet) is False
 
+    def test_notset_singleton(self):
+        """Test NotSetType keeps a single instance, also across copy and pickle."""
+        import copy, pickle
+        from gceutils.base import NotSet, NotSetType
+        assert NotSetType() is NotSet
+        assert copy.deepcopy(NotSet) is NotSet
+        assert pickle.loads(pickle.dumps(NotSet)) is NotSet
+
 
 class TestAbstractTreePathAdvanced:
     """Advanced tests for AbstractTreePath."""
@@ -329,7 +405,14 @@ class TestAbstractTreePathAdvanced:
         from gceutils.base import AbstractTreePath
         with pytest.raises(ValueError, match="path must be an iterable of ATPathAttribute or ATPathIndexOrKey"):
             AbstractTreePath(path=["not", "valid"])
-    
+
+    def test_init_from_generator(self):
+        """Test AbstractTreePath init consumes a generator only once."""
+        from gceutils.base import AbstractTreePath, ATPathAttribute
+        path = AbstractTreePath(path=(ATPathAttribute(name) for name in ("a", "b")))
+        assert len(path) == 2
+        assert path.repr_as_python_code() == ".a.b"
+
     def test_add_attribute_non_string(self):
         """Test add_attribute with non-string."""
         from gceutils.base import AbstractTreePath
@@ -443,7 +526,20 @@ class TestAbstractTreePathAdvanced:
         path = AbstractTreePath().add_index_or_key(10)
         with pytest.raises(ValueError, match="Failed to get index or key"):
             path.get_in_tree(obj)
-    
+
+    def test_get_in_tree_unrelated_error_propagates(self):
+        """Test get_in_tree does not swallow errors raised by the accessed objects themselves."""
+        from gceutils.base import AbstractTreePath
+
+        class Broken:
+            @property
+            def value(self):
+                raise RuntimeError("broken property")
+
+        path = AbstractTreePath().add_attribute("value")
+        with pytest.raises(RuntimeError, match="broken property"):
+            path.get_in_tree(Broken(), default=None)
+
     def test_get_in_tree_keys_special_case(self):
         """Test get_in_tree with dict keys() special case."""
         from gceutils.base import AbstractTreePath
@@ -546,7 +642,17 @@ class TestAbstractTreePathAdvanced:
         path2 = AbstractTreePath().add_attribute("b")
         extended = path1.extend(path2)
         assert len(extended) == 2
-    
+
+    def test_extend_with_empty(self):
+        """Test extend with an empty path on either side."""
+        from gceutils.base import AbstractTreePath
+
+        path = AbstractTreePath().add_attribute("a")
+        assert path.extend(AbstractTreePath()) is path
+        extended = AbstractTreePath(start_with_dot=False).extend(path)
+        assert extended.path == path.path
+        assert extended.start_with_dot is False
+
     def test_add_operator(self):
         """Test + operator for path concatenation."""
         from gceutils.base import AbstractTreePath
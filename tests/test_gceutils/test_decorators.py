@@ -1,7 +1,7 @@
 from __future__ import annotations
 import pytest
-from types import SimpleNamespace
-from typing import Any, TypeVar, Literal, NewType, Iterable, Sequence, Mapping
+from types import ModuleType, SimpleNamespace
+from typing import Any, TypeVar, Literal, NewType, Iterable, Sequence, Mapping, Union
 
 from gceutils import decorators
 
@@ -260,6 +260,56 @@ class TestEnforceType:
         other_cls = type("O", (), {"__module__": "tests.custom"})
         assert decorators._repr_type(other_cls) == "tests.custom.O"
 
+    def test_enforce_type_union_of_classes_and_generics(self):
+        """Plain class arms and parameterized arms of one union are both accepted."""
+        enforce_type(None, int | list[str] | None)
+        enforce_type(3, int | list[str] | None)
+        enforce_type(["a"], int | list[str] | None)
+        with pytest.raises(GU_TypeValidationError, match=r"must be one of types"):
+            enforce_type([1], int | list[str] | None)
+
+    def test_enforce_type_abstract_collection_origins(self):
+        """Mutable and set ABCs from typing/collections.abc validate their elements too."""
+        import typing
+        from collections.abc import MutableMapping, MutableSequence
+
+        enforce_type([1, 2], MutableSequence[int])
+        enforce_type({"a": 1}, typing.MutableMapping[str, int])
+        enforce_type(frozenset({1}), typing.AbstractSet[int])
+        with pytest.raises(GU_TypeValidationError, match=r"must be of type int not str"):
+            enforce_type([1, "2"], typing.MutableSequence[int])
+        with pytest.raises(GU_TypeValidationError, match=r"must be a MutableMapping not"):
+            enforce_type(SimpleNamespace(), MutableMapping[str, int])
+        with pytest.raises(GU_TypeValidationError, match=r"must be of type int not str"):
+            enforce_type({"a"}, typing.AbstractSet[int])
+
+    def test_enforce_type_iterable_does_not_consume_iterators(self):
+        """Iterators are only checked to be iterable, so the callee still receives all items."""
+        items = (str(i) for i in range(3))
+        enforce_type(items, Iterable[int])
+        assert list(items) == ["0", "1", "2"]
+
+    def test_enforce_type_error_paths_for_nested_values(self):
+        """The error path points at the offending nested value, also after a failed union arm."""
+        from gceutils.base import AbstractTreePath
+        root = AbstractTreePath().add_attribute("x")
+
+        with pytest.raises(GU_TypeValidationError) as exc_info:
+            enforce_type({"a": [1, "b"]}, dict[str, list[int]], root)
+        assert exc_info.value.path == root.add_index_or_key("a").add_index_or_key(1)
+
+        with pytest.raises(GU_TypeValidationError) as exc_info:
+            enforce_type({"a": 1, 2: 2}, dict[str, int], root)
+        assert exc_info.value.path == root.add_attribute("keys()").add_index_or_key(1)
+
+        with pytest.raises(GU_TypeValidationError) as exc_info:
+            enforce_type({"a": 1, 2: 2}, dict[str | bytes, int], root)
+        assert exc_info.value.path == root.add_attribute("keys()").add_index_or_key(1)
+
+        with pytest.raises(GU_TypeValidationError) as exc_info:
+            enforce_type([["a"], 5], list[list[int] | list[str]], root)
+        assert exc_info.value.path == root.add_index_or_key(1)
+
 
 class TestEnforceArgumentTypes:
     """Test enforce_argument_types decorator."""
@@ -369,13 +419,14 @@ class TestEnforceArgumentTypes:
         assert takes_typevar(123) == 123  # TYPE_T is a TypeVar; branch should skip
         assert calls == []  # enforce_type never called when TypeVar annotations are encountered
 
-    def test_enforce_argument_types_typing_typevar_marker(self):
-        """Object mimicking typing.TypeVar bypasses enforcement via first skip check."""
+    def test_enforce_argument_types_typevar_lookalike_not_skipped(self):
+        """Only real TypeVar instances are skipped, not objects mimicking typing.TypeVar's attributes."""
         @enforce_argument_types
         def take_fake(value: FAKE_TYPEVAR):
             return value
 
-        assert take_fake("ok") == "ok"
+        with pytest.raises(GU_TypeValidationError):
+            take_fake("ok")
 
     def test_enforce_argument_types_methods_and_classmethods(self):
         """Cover skip_first logic plus classmethod/staticmethod handling."""
@@ -407,3 +458,109 @@ class TestEnforceArgumentTypes:
         assert Greeter.static_method(True) is True
         with pytest.raises(GU_TypeValidationError):
             Greeter.static_method("nope")
+
+    def test_enforce_argument_types_forward_reference(self, monkeypatch):
+        """Annotations which can not be resolved at decoration time are resolved on the first call."""
+        @enforce_argument_types
+        def takes_later(value: NotYetDefined) -> None:
+            return None
+
+        monkeypatch.setitem(globals(), "NotYetDefined", int)
+        takes_later(1)
+        with pytest.raises(GU_TypeValidationError):
+            takes_later("x")
+
+    def test_enforce_argument_types_attribute_error_deferred(self, monkeypatch):
+        """A hint failing with AttributeError at decoration time (e.g. a partially imported module) is resolved on the first call."""
+        partial_module = ModuleType("partial_module")
+        monkeypatch.setitem(globals(), "partial_module", partial_module)
+
+        @enforce_argument_types
+        def takes_later(value: partial_module.Later) -> None:
+            return None
+
+        partial_module.Later = int
+        takes_later(1)
+        with pytest.raises(GU_TypeValidationError):
+            takes_later("x")
+
+    def test_enforce_argument_types_invalid_hint_raises_at_decoration(self):
+        """Only unresolved names are deferred; a broken annotation fails when the function is decorated."""
+        with pytest.raises(SyntaxError):
+            @enforce_argument_types
+            def broken(value: "not valid python") -> None:
+                return None
+
+    def test_enforce_argument_types_error_path_per_argument(self):
+        """Arguments share one frame stack per call; the error path only names the failing argument."""
+        @enforce_argument_types
+        def takes_two(first: list[int], second: dict[str, list[int]]) -> None:
+            return None
+
+        takes_two([1], {"k": [1]})
+        with pytest.raises(GU_TypeValidationError) as exc_info:
+            takes_two([1], {"k": [1, "x"]})
+        assert str(exc_info.value).startswith("At second['k'][1]:")
+
+    def test_enforce_argument_types_keyword_and_positional_calls(self):
+        """Positional, keyword and keyword-only arguments are all checked."""
+        @enforce_argument_types
+        def scale(value: int, factor: int = 2, *, offset: int = 0) -> int:
+            return value * factor + offset
+
+        assert scale(1, 3) == 3
+        assert scale(value=1, factor=3, offset=1) == 4
+        with pytest.raises(GU_TypeValidationError):
+            scale(1, "3")
+        with pytest.raises(GU_TypeValidationError):
+            scale(1, offset="1")
+        with pytest.raises(TypeError):
+            scale(1, 2, 3)
+
+    def test_enforce_argument_types_disabled_by_env(self, monkeypatch):
+        """With GCEUTILS_DISABLE_TYPECHECK=1 the decorator returns the function unchanged."""
+        monkeypatch.setattr(decorators, "_TYPECHECK_DISABLED", True)
+
+        def takes_int(value: int) -> int:
+            return value
+
+        assert enforce_argument_types(takes_int) is takes_int
+        assert takes_int("not checked") == "not checked"
+
+    def test_enforce_argument_types_without_annotations_returns_func(self):
+        """Functions with nothing to check are not wrapped at all."""
+        def plain(value, other=1):
+            return value
+
+        class Holder:
+            def method(self) -> int:
+                return 1
+
+        assert enforce_argument_types(plain) is plain
+        assert enforce_argument_types(Holder.method) is Holder.method
+
+    def test_parameter_shape_from_code_and_signature(self):
+        """Plain functions are read from their code object, wrappers via their signature."""
+        from functools import wraps
+
+        def positional(a, b=1, /, c=2):
+            pass
+
+        def mixed(a, *args, b, **kwargs):
+            pass
+
+        @wraps(positional)
+        def wrapper(*args, **kwargs):
+            pass
+
+        assert decorators._parameter_shape(positional) == (("a", "b", "c"), True)
+        assert decorators._parameter_shape(mixed) == (("a",), False)
+        assert decorators._parameter_shape(wrapper) == (("a", "b", "c"), True)
+
+    def test_compiled_validators_are_cached(self):
+        """Each annotation is compiled once and reused by enforce_type and decorated functions."""
+        assert decorators._get_validator(list[int]) is decorators._get_validator(list[int])
+        assert decorators._get_validator(int | str) is not decorators._get_validator(Union[int, str])
+        assert decorators._cached_validator.cache_info().maxsize is not None # bounded, annotations are not kept forever
+        with pytest.raises(GU_TypeValidationError, match=r"must be one of types int \| str not float"):
+            enforce_type(1.5, int | str)
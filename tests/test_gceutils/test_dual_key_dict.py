@@ -170,6 +170,21 @@ class TestDualKeyDictRepresentation:
 class TestDualKeyDictFromMethods:
     """Test DualKeyDict factory methods."""
     
+    def test_str_keys_are_interned(self):
+        """str keys are interned by set, the constructor and from_single_key_value alike."""
+        import sys
+        dynamic = "".join(["dyn", "amic", "_key"]) # built at runtime, so not interned yet
+        expected = sys.intern("dynamic_key")
+
+        from_set = DualKeyDict()
+        from_set.set(dynamic, dynamic, 1)
+        from_init = DualKeyDict({(dynamic, dynamic): 1})
+        from_single = DualKeyDict.from_single_key_value([(dynamic, 1)])
+
+        for dkd in (from_set, from_init, from_single):
+            assert next(iter(dkd.keys_key1())) is expected
+            assert next(iter(dkd.keys_key2())) is expected
+    
     def test_from_single_key_value(self):
         """Test creating DualKeyDict from single key-value pairs."""
         data = [("a", 1), ("b", 2), ("c", 3)]
@@ -181,6 +196,16 @@ class TestDualKeyDictFromMethods:
         assert dkd.has_key1("c")
         assert dkd.has_key2("c")
     
+    def test_from_methods_check_argument_types(self):
+        """The factory classmethods still validate their arguments."""
+        with pytest.raises(TypeError):
+            DualKeyDict.from_single_key_value(5)
+        with pytest.raises(TypeError):
+            DualKeyDict.from_both_keys(5, "value")
+
+        dkd = DualKeyDict.from_single_key_value([("a", 1), ("a", 2)])
+        assert list(dkd.items_key1_key2()) == [("a", "a", 2)]
+    
     def test_from_both_keys(self):
         """Test creating DualKeyDict from both keys with single value."""
         data = [("a", "x"), ("b", "y"), ("c", "z")]
@@ -202,6 +227,18 @@ class TestDualKeyDictFromMethods:
         assert len(dkd) == 3
         assert dkd.get_by_key1("a") == 1
         assert dkd.get_by_key2("y") == 2
+    
+    def test_from_validated_mapping(self):
+        """from_validated_mapping builds the same dict as the constructor and still rejects conflicts."""
+        mapping = {("a", "x"): 1, ("b", "y"): 2}
+        dkd = DualKeyDict.from_validated_mapping(mapping)
+        assert dkd == DualKeyDict(mapping)
+        assert dkd.get_by_key2("y") == 2
+
+        with pytest.raises(ValueError, match=r"key1 'a' already exists with different key2 'x'"):
+            DualKeyDict.from_validated_mapping({("a", "x"): 1, ("a", "y"): 2})
+        with pytest.raises(ValueError, match=r"key2 'x' already exists with different key1 'a'"):
+            DualKeyDict({("a", "x"): 1, ("b", "x"): 2})
 
 
 class TestDualKeyDictUpdate:
@@ -387,6 +424,16 @@ class TestDualKeyDictPop:
         
         assert result == "default_value"
 
+    def test_pop_with_default_existing_removes_both_keys(self):
+        """Pop with default on an existing entry removes it from both key sets."""
+        dkd = DualKeyDict({("a", "x"): 1, ("b", "y"): 2})
+        
+        assert dkd.pop_by_key1_with_default("a", None) == 1
+        assert dkd.pop_by_key2_with_default("y", None) == 2
+        assert len(dkd) == 0
+        assert not dkd.has_key2("x")
+        assert not dkd.has_key1("b")
+
 
 class TestDualKeyDictGetDefault:
     """Test get with default methods."""
@@ -503,6 +550,16 @@ class TestDualKeyDictItems:
         assert ("x", "a", 1) in items
         assert ("y", "b", 2) in items
 
+    def test_items_key2_order_matches_keys_key2(self):
+        """Items by key2 follow the key2 order, also after keys were changed."""
+        dkd = DualKeyDict({("a", "x"): 1, ("b", "y"): 2, ("c", "z"): 3})
+        dkd.change_key2_by_key1("a", "w")
+        dkd.change_key1_by_key2("y", "d")
+        dkd.update_by_key2("z", 4)
+
+        assert [key2 for key2, _ in dkd.items_key2()] == list(dkd.keys_key2())
+        assert list(dkd.items_key2_key1()) == [(key2, key1, dkd.get_by_key1(key1)) for key2, key1 in dkd.keys_key2_key1()]
+
 
 class TestDualKeyDictValues:
     """Test value iteration."""
@@ -518,6 +575,29 @@ class TestDualKeyDictValues:
         assert 1 in values
         assert 2 in values
         assert 3 in values
+    
+    def test_views_are_sized_and_reiterable(self):
+        """values, items_key1 and keys_key1_key2 return sized views that can be iterated again."""
+        dkd = DualKeyDict({("a", "x"): 1, ("b", "y"): 2})
+        
+        values = dkd.values()
+        assert len(values) == 2
+        assert list(values) == list(values) == [1, 2]
+        assert 2 in values and 3 not in values
+        
+        items = dkd.items_key1()
+        assert len(items) == 2
+        assert list(items) == list(items) == [("a", 1), ("b", 2)]
+        assert ("a", 1) in items and ("a", 2) not in items and "a" not in items
+        
+        key_pairs = dkd.keys_key1_key2()
+        assert len(key_pairs) == 2
+        assert list(key_pairs) == list(key_pairs) == [("a", "x"), ("b", "y")]
+        assert ("b", "y") in key_pairs and ("b", "x") not in key_pairs
+        assert key_pairs & {("a", "x"), ("c", "z")} == {("a", "x")}
+        
+        dkd.set("c", "z", 3) # views are live, like dict views
+        assert len(values) == 3
 
 
 class TestDualKeyDictOperators:
@@ -567,6 +647,15 @@ class TestDualKeyDictOperators:
         with pytest.raises(ValueError):
             dkd1 |= dkd2
     
+    def test_ior_conflict_leaves_dict_unchanged(self):
+        """A conflicting |= is rejected before any entry is merged."""
+        dkd1 = DualKeyDict({("a", "x"): 1})
+        dkd2 = DualKeyDict({("b", "y"): 2, ("c", "x"): 3})
+        
+        with pytest.raises(ValueError, match="key2 'x' already exists"):
+            dkd1 |= dkd2
+        assert dkd1 == DualKeyDict({("a", "x"): 1})
+    
     def test_eq(self):
         """Test equality."""
         dkd1 = DualKeyDict()
@@ -595,6 +684,53 @@ class TestDualKeyDictOperators:
         result = dkd.__eq__({})
         assert result == NotImplemented
 
+    def test_merge_new_entries(self):
+        """|, |= and update add entries whose keys do not exist yet."""
+        dkd1 = DualKeyDict()
+        dkd1.set("a", "x", 1)
+        dkd2 = DualKeyDict()
+        dkd2.set("b", "y", 2)
+
+        merged = dkd1 | dkd2
+        assert list(merged.items_key1_key2()) == [("a", "x", 1), ("b", "y", 2)]
+        assert len(dkd1) == 1
+
+        dkd1 |= dkd2
+        assert dkd1 == merged
+        assert dkd1.get_by_key2("y") == 2
+
+        dkd3 = DualKeyDict()
+        dkd3.update(dkd2)
+        assert dkd3 == dkd2
+
+    def test_ior_not_dualkey(self):
+        """|= with a non-DualKeyDict is rejected with a TypeError."""
+        dkd = DualKeyDict()
+        dkd.set("a", "x", 1)
+
+        assert dkd.__ior__({}) is NotImplemented
+        with pytest.raises(TypeError):
+            dkd |= {}
+
+    def test_merge_methods_reject_non_dualkey(self):
+        """|, reversed | and update only merge other DualKeyDicts."""
+        dkd = DualKeyDict({("a", "x"): 1})
+
+        with pytest.raises(TypeError):
+            dkd | {}
+        with pytest.raises(TypeError):
+            {} | dkd
+        with pytest.raises(TypeError):
+            dkd.update({("b", "y"): 2})
+        assert len(dkd) == 1
+
+    def test_slots(self):
+        """Instances use slots instead of a __dict__."""
+        dkd = DualKeyDict()
+        assert not hasattr(dkd, "__dict__")
+        with pytest.raises(AttributeError):
+            dkd.other = 1
+
 
 class TestDualKeyDictForbidden:
     """Test forbidden operations."""
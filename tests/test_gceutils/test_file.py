@@ -1,6 +1,7 @@
 from __future__ import annotations
 import pytest
 import tempfile
+from io import BytesIO
 from pathlib import Path
 import zipfile
 import zlib
@@ -8,7 +9,7 @@ import os
 
 from gceutils.file import (
     read_all_files_of_zip, read_file_text, write_file_text,
-    delete_file, delete_directory, create_zip_file, file_exists
+    delete_file, delete_directory, create_zip_file, file_exists, file_exists_cached
 )
 from gceutils.errors import (
     GU_FileNotFoundError, GU_FailedFileWriteError, GU_FailedFileDeleteError, GU_FailedFileReadError
@@ -286,6 +287,18 @@ class TestCreateZipFile:
                 assert z.read("dir1/file1.txt") == b"Nested content 1"
                 assert z.read("dir1/dir2/file2.txt") == b"Nested content 2"
 
+    def test_create_zip_file_sorted_and_stores_compressed_data(self, tmp_path):
+        """Entries are written in name order; already compressed data is stored, not deflated."""
+        zip_path = tmp_path / "mixed.zip"
+        png_data = b"\x89PNG\r\n\x1a\n" + bytes(64)
+        create_zip_file(zip_path, {"b.txt": b"text " * 20, "a.png": png_data})
+
+        with zipfile.ZipFile(zip_path, "r") as z:
+            assert z.namelist() == ["a.png", "b.txt"]
+            assert z.getinfo("a.png").compress_type == zipfile.ZIP_STORED
+            assert z.getinfo("b.txt").compress_type == zipfile.ZIP_DEFLATED
+            assert z.read("a.png") == png_data
+
 
 class TestReadAllFilesOfZip:
     """Test read_all_files_of_zip function."""
@@ -339,10 +352,20 @@ class TestReadAllFilesOfZip:
         finally:
             Path(bad_path).unlink(missing_ok=True)
 
+    def test_read_all_files_of_zip_skips_directories(self, tmp_path):
+        """Directory entries are not returned as files."""
+        zip_path = tmp_path / "dirs.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_out:
+            zip_out.mkdir("folder")
+            zip_out.writestr("folder/file.txt", b"data")
+
+        assert read_all_files_of_zip(zip_path) == {"folder/file.txt": b"data"}
+
     def test_read_all_files_of_zip_entry_extraction_error(self, monkeypatch, tmp_path):
         """Entry extraction error (zlib) is wrapped as GU_FailedFileReadError."""
         zip_path = tmp_path / "test.zip"
-        create_zip_file(zip_path, {"bad.txt": b"data"})
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_BZIP2) as zip_out:
+            zip_out.writestr("bad.txt", b"data") # bzip2 members are read through ZipFile.open
 
         original_zipfile = zipfile.ZipFile
 
@@ -357,6 +380,33 @@ class TestReadAllFilesOfZip:
         finally:
             monkeypatch.setattr(zipfile, "ZipFile", original_zipfile)
 
+    def test_read_all_files_of_zip_mixed_compression(self):
+        """Stored, deflated and bzip2 members are all read back unchanged."""
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_out:
+            zip_out.writestr("stored.bin", b"stored" * 10, compress_type=zipfile.ZIP_STORED)
+            zip_out.writestr("deflated.txt", b"deflated" * 100, compress_type=zipfile.ZIP_DEFLATED)
+            zip_out.writestr("bzip2.txt", b"bzip2" * 100, compress_type=zipfile.ZIP_BZIP2)
+            zip_out.writestr("empty.txt", b"", compress_type=zipfile.ZIP_DEFLATED)
+
+        assert read_all_files_of_zip(buffer) == {
+            "stored.bin": b"stored" * 10,
+            "deflated.txt": b"deflated" * 100,
+            "bzip2.txt": b"bzip2" * 100,
+            "empty.txt": b"",
+        }
+
+    def test_read_all_files_of_zip_corrupt_member(self):
+        """Damaged member data fails the CRC check and is reported as GU_FailedFileReadError."""
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_out:
+            zip_out.writestr("file.bin", b"0123456789", compress_type=zipfile.ZIP_STORED)
+        archive = bytearray(buffer.getvalue())
+        archive[archive.index(b"0123456789")] = ord("X")
+
+        with pytest.raises(GU_FailedFileReadError):
+            read_all_files_of_zip(BytesIO(bytes(archive)))
+
 
 class TestFileExists:
     """Test file_exists function."""
@@ -413,3 +463,19 @@ class TestFileExists:
         monkeypatch.setattr(os.path, "exists", boom)
         with pytest.raises(OSError):
             file_exists("anything")
+
+
+class TestFileExistsCached:
+    """Test file_exists_cached function."""
+
+    def test_file_exists_cached_remembers_until_cleared(self, tmp_path):
+        """Results are cached per path (str and Path alike) until cache_clear is called."""
+        file_path = tmp_path / "cached.txt"
+        file_exists_cached.cache_clear()
+        assert file_exists_cached(file_path) is False
+
+        file_path.write_text("x")
+        assert file_exists_cached(str(file_path)) is False
+
+        file_exists_cached.cache_clear()
+        assert file_exists_cached(file_path) is True
@@ -138,6 +138,11 @@ class TestGrepr:
         assert grepr(set()) == "{}"
         assert grepr({}) == "{}"
 
+    def test_keyreprdict_multiline_keys(self):
+        """Long KeyReprDict keys are laid out like a multiline collection."""
+        kd = KeyReprDict({"a" * 50: 1, "b" * 50: 2})
+        assert grepr(kd, indent=2) == 'KeyReprDict(keys={\n  "%s",\n  "%s",\n})' % ("a" * 50, "b" * 50)
+
     def test_dual_key_dict_empty_and_safe(self):
         """Cover DualKeyDict empty formatting for safe and non-safe modes."""
         empty = DualKeyDict()
@@ -182,6 +187,46 @@ class TestGrepr:
         result = grepr(Hidden())
         assert result == "Hidden()"
 
+    def test_dataclass_grepr_fields_precomputed(self):
+        """The decorator precomputes the shown field names; an overridden get_field_options still wins."""
+        @grepr_dataclass()
+        class Partly:
+            a: int = 1
+            b: int = field(default=2, grepr=False)
+
+        assert Partly.__grepr_fields__ == ("a",)
+
+        class ShowAll(GreprRepresentationImplementation):
+            def get_field_options(self, field):
+                return {"grepr": True}
+
+        assert ShowAll(indent=None).recursively_format(Partly()) == "Partly(a=1, b=2)"
+
+    def test_layout_cached_per_level(self):
+        """Indent strings are built once per level and reused."""
+        formatter = GreprRepresentationImplementation(indent=2)
+        assert formatter.layout(1) == (2, "\n    ", ",\n    ", ",\n  ")
+        assert formatter.layout(1) is formatter.layout(1)
+        assert GreprRepresentationImplementation(indent=None).layout(3) == (3, "", ", ", "")
+
+    def test_dataclass_field_options_looked_up_once_per_class(self):
+        """One formatter resolves the shown fields of a class only once."""
+        @grepr_dataclass()
+        class Point:
+            x: int
+            y: int
+
+        class CountingOptions(GreprRepresentationImplementation):
+            calls = 0
+
+            def get_field_options(self, field):
+                CountingOptions.calls += 1
+                return {"grepr": field.name == "x"}
+
+        result = CountingOptions(indent=None).recursively_format([Point(1, 2), Point(3, 4)])
+        assert result == "[Point(x=1), Point(x=3)]"
+        assert CountingOptions.calls == 2
+
     def test_dataclass_without_field_annotation_names(self):
         """annotate_fields=False should omit field names in output."""
         @grepr_dataclass()
@@ -214,6 +259,14 @@ class TestGrepr:
 
         assert repr(Color.RED) == "Color.RED"
 
+    def test_leaf_types_and_subclasses(self):
+        """Plain leaves use repr; a str subclass still gets grepr quoting."""
+        class Name(str):
+            pass
+
+        assert grepr([None, True, 1.5, b"x"]) == "[None, True, 1.5, b'x']"
+        assert grepr(Name("abc")) == '"abc"'
+
     def test_fallback_repr_for_unknown_obj(self):
         """Objects outside supported types fall back to built-in repr (indent unchanged)."""
         class Unknown:
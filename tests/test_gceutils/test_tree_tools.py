@@ -128,6 +128,25 @@ class TestTreeVisitor:
         paths = list(result.keys())
         assert len(set(str(p) for p in paths)) == 4
 
+    def test_visit_depth_first_order(self):
+        """Values are visited depth first, children before later siblings."""
+        visitor = TreeVisitor.create_new_include_only([int])
+        result = visitor.visit_tree({"a": [1, [2, 3]], "b": (4,)})
+        
+        assert list(result.values()) == [1, 2, 3, 4]
+    
+    def test_visit_deeper_than_recursion_limit(self):
+        """Deeply nested trees do not hit the interpreter recursion limit."""
+        import sys
+        tree = current = []
+        for _ in range(sys.getrecursionlimit() + 100):
+            current.append([])
+            current = current[0]
+        current.append(7)
+        
+        visitor = TreeVisitor.create_new_include_only([int])
+        assert list(visitor.visit_tree(tree).values()) == [7]
+
 
 class TestTreeVisitorDataclass:
     """Test TreeVisitor with dataclasses."""
@@ -216,6 +235,17 @@ class TestTreeVisitorWithCustom:
         # Should find all values through custom method
         assert len(result) >= 4
     
+    def test_container_subclass_with_custom_visit_is_traversed_as_container(self):
+        """Containers are traversed as containers even when they define _visit_node_unfiltered_."""
+        class CustomList(list):
+            def _visit_node_unfiltered_(self, path):
+                return [(path.add_attribute("custom"), "custom")]
+        
+        visitor = TreeVisitor.create_new_include_only([int, str])
+        result = visitor.visit_tree([CustomList([1, 2])])
+        
+        assert [tuple(item.value for item in path.path) for path in result] == [(0, 0), (0, 1)]
+    
     def test_visit_non_dataclass_no_traversal(self):
         """Test that non-dataclass, non-collection objects don't have attributes traversed."""
         
@@ -26,6 +26,14 @@ class TestValidator:
         )
         assert validator is not None
     
+    def test_is_valid_arg_count_shared_fn(self):
+        """Validators sharing an is_valid_fn report the same argument count."""
+        is_between = lambda value, low, high: low <= value <= high
+        first = Validator(is_valid_fn=is_between, error_cls=GU_RangeValidationError, create_error_fn=lambda value, descr, low, high: descr)
+        second = Validator(is_valid_fn=is_between, error_cls=GU_InvalidValueError, create_error_fn=lambda value, descr, low, high: descr)
+        
+        assert first.is_valid_arg_count == second.is_valid_arg_count == 5
+    
     def test_validator_call_success(self):
         """Test validator call with valid value."""
         @grepr_dataclass()